@@ -25,6 +25,8 @@ from adapters.tool_translator import ToolTranslator
 from common.logging import TimedLogger, get_logger
 
 if TYPE_CHECKING:
+    import httpx
+
     from mcp.mcp2025_server import MCP2025Server
 
 logger = get_logger(__name__)
@@ -33,27 +35,34 @@ logger = get_logger(__name__)
 class AnthropicAdapter(BaseAdapter):
     """Anthropic adapter with MCP-based dynamic configuration."""
 
-    def __init__(self, mcp_server: Optional["MCP2025Server"] = None):
+    def __init__(
+        self,
+        mcp_server: Optional["MCP2025Server"] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        api_key: Optional[str] = None,
+    ):
         """
         Initialize Anthropic adapter with MCP server.
 
         Args:
             mcp_server: MCP 2025 server for dynamic configuration (required)
+            http_client: Shared HTTP connection pool for the Anthropic client
+            api_key: API key to use; defaults to the ANTHROPIC_API_KEY environment variable
         """
-        super().__init__(mcp_server)
+        super().__init__(mcp_server, http_client)
 
         if anthropic is None:
             raise ImportError("anthropic package not installed. Install with: uv add anthropic")
 
-        # Get API key from environment
-        api_key = os.getenv("ANTHROPIC_API_KEY")
+        # Fall back to the API key from environment
+        api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable not set")
 
         if AsyncAnthropic is None:
             raise ImportError("anthropic package not properly imported")
 
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = AsyncAnthropic(api_key=api_key, http_client=http_client)
         self.provider_name = "anthropic"
 
         logger.info(
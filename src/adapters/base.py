@@ -14,6 +14,8 @@ from typing import Any, AsyncGenerator, Dict, List, Optional, TYPE_CHECKING
 from pydantic import BaseModel, Field
 
 if TYPE_CHECKING:
+    import httpx
+
     from mcp.mcp2025_server import MCP2025Server
 
 
@@ -43,21 +45,39 @@ class AdapterResponse(BaseModel):
 class BaseAdapter(ABC):
     """Base class for AI provider adapters."""
 
-    def __init__(self, mcp_server: Optional["MCP2025Server"] = None):
+    def __init__(
+        self,
+        mcp_server: Optional["MCP2025Server"] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+    ):
         """
         Initialize adapter with MCP server.
 
         Args:
             mcp_server: MCP 2025 server instance for dynamic configuration.
                        If None, adapter will fail on first use (fail-fast).
+            http_client: Shared HTTP connection pool for provider SDK clients.
+                        If None, each SDK creates its own.
         """
         self.mcp_server = mcp_server
+        self.http_client = http_client
         if not self.mcp_server:
             # Log warning but don't fail yet - fail on first use
             import logging
 
             logging.warning("Adapter initialized without MCP server - will fail on first use")
 
+    async def aclose(self) -> None:
+        """
+        Release the adapter's network resources.
+
+        An SDK client running on a caller-provided http_client is left open, since
+        the caller owns that connection pool.
+        """
+        client = getattr(self, "client", None)
+        if client is not None and self.http_client is None:
+            await client.close()
+
     @abstractmethod
     def supports_function_calling(self) -> bool:
         """Capability probe - does this adapter support function calling?"""
@@ -28,6 +28,8 @@ from adapters.tool_translator import ToolTranslator
 from common.logging import TimedLogger, get_logger
 
 if TYPE_CHECKING:
+    import httpx
+
     from mcp.mcp2025_server import MCP2025Server
 
 logger = get_logger(__name__)
@@ -36,22 +38,30 @@ logger = get_logger(__name__)
 class GeminiAdapter(BaseAdapter):
     """Gemini adapter with MCP-based dynamic configuration."""
 
-    def __init__(self, mcp_server: Optional["MCP2025Server"] = None):
+    def __init__(
+        self,
+        mcp_server: Optional["MCP2025Server"] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        api_key: Optional[str] = None,
+    ):
         """
         Initialize Gemini adapter with MCP server.
 
         Args:
             mcp_server: MCP 2025 server for dynamic configuration (required)
+            http_client: Shared HTTP connection pool; unused, the Gemini SDK manages its own transport
+            api_key: API key to use; defaults to the GEMINI_API_KEY environment variable.
+                    The Gemini SDK is configured process-wide, so only one key is in effect
         """
-        super().__init__(mcp_server)
+        super().__init__(mcp_server, http_client)
 
         if genai is None:
             raise ImportError(
                 "google-generativeai package not installed. Install with: uv add google-generativeai"
             )
 
-        # Get API key from environment
-        api_key = os.getenv("GEMINI_API_KEY")
+        # Fall back to the API key from environment
+        api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise ValueError("GEMINI_API_KEY environment variable not set")
 
@@ -0,0 +1,89 @@
+"""
+Key-balanced adapter for spreading one provider's traffic across API keys.
+
+Following PROJECT_RULES.md:
+- Single responsibility: Pick an underlying adapter per request
+- Async design for I/O operations
+- Strict mode: no retries or fallbacks between keys
+"""
+
+import asyncio
+from typing import Any, AsyncGenerator, Dict, List, Sequence
+
+from adapters.base import AdapterRequest, AdapterResponse, BaseAdapter
+
+
+class KeyBalancedAdapter(BaseAdapter):
+    """
+    Adapter that routes each request to one of several adapters for the same
+    provider, each built with a different API key.
+
+    Every key is its own rate-limit bucket, so requests go to the adapter with
+    the fewest requests in flight; ties rotate round-robin.
+    """
+
+    def __init__(self, adapters: Sequence[BaseAdapter]):
+        """
+        Initialize the balancer.
+
+        Args:
+            adapters: Adapters for one provider, one per API key (at least one)
+        """
+        if not adapters:
+            raise ValueError("KeyBalancedAdapter requires at least one adapter")
+
+        first = adapters[0]
+        super().__init__(first.mcp_server, first.http_client)
+        self.adapters = tuple(adapters)
+        self.provider_name = getattr(first, "provider_name", None)
+        # Requests currently streaming per adapter, indexed like self.adapters
+        self._in_flight = [0] * len(self.adapters)
+        # Index the next least-loaded search starts from, so ties rotate
+        self._next = 0
+
+    def _pick(self) -> int:
+        """Return the index of the least-loaded adapter, rotating between ties."""
+        count = len(self.adapters)
+        start = self._next
+        index = min(range(start, start + count), key=lambda i: self._in_flight[i % count]) % count
+        self._next = (index + 1) % count
+        return index
+
+    def supports_function_calling(self) -> bool:
+        """Capability probe - delegated to the underlying adapters."""
+        return self.adapters[0].supports_function_calling()
+
+    def supports_streaming(self) -> bool:
+        """Capability probe - delegated to the underlying adapters."""
+        return self.adapters[0].supports_streaming()
+
+    def translate_tools(self, mcp_tools: List[Dict[str, Any]]) -> Any:
+        """Schema transformer - delegated to the underlying adapters."""
+        return self.adapters[0].translate_tools(mcp_tools)
+
+    async def chat_completion(
+        self, request: AdapterRequest
+    ) -> AsyncGenerator[AdapterResponse, None]:
+        """Stream the chat completion from the least-loaded adapter."""
+        index = self._pick()
+        self._in_flight[index] += 1
+        try:
+            async for response in self.adapters[index].chat_completion(request):  # type: ignore
+                yield response
+        finally:
+            self._in_flight[index] -= 1
+
+    async def health_check(self) -> bool:
+        """Check every key concurrently; healthy only if all keys are."""
+        results = await asyncio.gather(
+            *(adapter.health_check() for adapter in self.adapters), return_exceptions=True
+        )
+        return all(result is True for result in results)
+
+    async def generate_image(self, prompt: str, **kwargs) -> str:
+        """Generate an image with the least-loaded adapter."""
+        return await self.adapters[self._pick()].generate_image(prompt, **kwargs)
+
+    async def aclose(self) -> None:
+        """Release the network resources of every underlying adapter."""
+        await asyncio.gather(*(adapter.aclose() for adapter in self.adapters))
@@ -21,6 +21,8 @@ from adapters.tool_translator import ToolTranslator
 from common.logging import TimedLogger, get_logger
 
 if TYPE_CHECKING:
+    import httpx
+
     from mcp.mcp2025_server import MCP2025Server
 
 logger = get_logger(__name__)
@@ -29,21 +31,28 @@ logger = get_logger(__name__)
 class OpenAIAdapter(BaseAdapter):
     """OpenAI adapter with MCP-based dynamic configuration."""
 
-    def __init__(self, mcp_server: Optional["MCP2025Server"] = None):
+    def __init__(
+        self,
+        mcp_server: Optional["MCP2025Server"] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        api_key: Optional[str] = None,
+    ):
         """
         Initialize OpenAI adapter with MCP server.
 
         Args:
             mcp_server: MCP 2025 server for dynamic configuration (required)
+            http_client: Shared HTTP connection pool for the OpenAI client
+            api_key: API key to use; defaults to the OPENAI_API_KEY environment variable
         """
-        super().__init__(mcp_server)
+        super().__init__(mcp_server, http_client)
 
-        # Get API key from environment
-        api_key = os.getenv("OPENAI_API_KEY")
+        # Fall back to the API key from environment
+        api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
 
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = AsyncOpenAI(api_key=api_key, http_client=http_client)
         self.provider_name = "openai"
 
         logger.info(
@@ -30,6 +30,21 @@ class RouterConfig(BaseModel):
     request_timeout: int = Field(default=60, description="Request timeout in seconds")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
 
+    # Cache of completed chat responses, used only by requests sending allow_cache
+    response_cache_size: int = Field(default=1000, description="Cached chat responses kept")
+    response_cache_ttl: float = Field(default=300.0, description="Cached response lifetime (s)")
+
+    # Placeholder handler latency (image/audio/frontend) - off unless simulating
+    simulation_mode: bool = Field(
+        default=False, description="Apply simulated delays in placeholder handlers"
+    )
+    image_gen_delay: float = Field(default=1.0, description="Simulated image generation delay (s)")
+    audio_start_delay: float = Field(default=0.8, description="Simulated TTS startup delay (s)")
+    audio_chunk_delay: float = Field(default=0.3, description="Simulated delay per audio chunk (s)")
+    frontend_command_delay: float = Field(
+        default=0.1, description="Simulated frontend command delay (s)"
+    )
+
 
 class ProviderConfig(BaseModel):
     """Configuration for AI providers - runtime configurable."""
@@ -7,6 +7,7 @@ Following PROJECT_RULES.md:
 - Never log tokens, secrets, or PII
 """
 
+import json
 import logging
 import time
 from typing import Any, Optional
@@ -15,6 +16,32 @@ import structlog
 
 from common.config import Config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _serialize_event(event_dict: Any, **dumps_kw: Any) -> str:
+    """
+    Serialize a log event for structlog's JSONRenderer.
+
+    Uses orjson when it is installed, falling back to the standard library.
+    Both paths keep the renderer's fallback handler for unserializable values.
+
+    Args:
+        event_dict: Event to serialize
+        **dumps_kw: json.dumps keyword arguments passed by the renderer
+
+    Returns:
+        JSON string for the stdlib log record
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            event_dict, default=dumps_kw.get("default"), option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(event_dict, **dumps_kw)
+
 
 def setup_logging(config: Config) -> None:
     """
@@ -32,7 +59,7 @@ def setup_logging(config: Config) -> None:
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_serialize_event),
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
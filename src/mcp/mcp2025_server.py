@@ -12,14 +12,14 @@ This replaces the legacy HTTP endpoints with proper MCP compliance.
 """
 
 import asyncio
-from typing import Dict, Any, Optional, Set
+from typing import Dict, Any, FrozenSet, Optional, Set, Tuple
 from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
 from datetime import datetime
 
 from common.logging import get_logger
 from common.runtime_config import get_runtime_config_persistence
-from .parameter_schemas import ModelParameterSchemas, PopularModels
+from .parameter_schemas import ModelParameterSchemas, ParameterInfo, PopularModels
 from .tool_registry import ToolRegistry, Tool
 from .jsonrpc import (
     JSONRPCHandler,
@@ -86,6 +86,9 @@ class MCP2025Server:
         """Initialize the MCP 2025 server."""
         self.config_persistence = get_runtime_config_persistence()
         self.config_cache = None  # Cache loaded configuration
+        self._active_config = None  # Derived from config_cache, cleared on every write
+        self._models_cache: Dict[str, Dict[str, Any]] = {}  # Model lists are static per process
+        self._model_names: Dict[str, FrozenSet[str]] = {}  # Names from _models_cache, for lookups
         self.tool_registry = ToolRegistry()
         self.state = MCPServerState()
 
@@ -326,18 +329,8 @@ class MCP2025Server:
         try:
             params = MCPToolsListParams.model_validate(request.params or {})
 
-            # Get all tools
-            all_tools = await self.tool_registry.list_tools()
-
-            # Convert tools to MCP format
-            mcp_tools = []
-            for tool in all_tools:
-                mcp_tool = {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "inputSchema": self._convert_tool_parameters_to_schema(tool),
-                }
-                mcp_tools.append(mcp_tool)
+            # Get all tools in MCP format, with schemas built at registration
+            mcp_tools = await self.tool_registry.list_mcp_tools()
 
             # Handle pagination
             cursor_index = 0
@@ -361,7 +354,7 @@ class MCP2025Server:
 
             logger.info(
                 event="tools_listed",
-                total_tools=len(all_tools),
+                total_tools=len(mcp_tools),
                 returned_tools=len(paginated_tools),
                 cursor=params.cursor,
                 next_cursor=next_cursor,
@@ -386,105 +379,120 @@ class MCP2025Server:
 
             params = MCPToolsCallParams.model_validate(request.params)
 
-            # Execute tool through registry
-            execution = await self.tool_registry.execute_tool(
-                tool_name=params.name, arguments=params.arguments or {}
+            result = MCPToolsCallResult.model_validate(
+                await self.call_tool(params.name, params.arguments or {})
             )
 
-            if execution.success:
-                # Convert result to MCP format with multi-type support
-                content = []
-                structured_content = None
-
-                # Add main result as text
-                if "message" in execution.result:
-                    content.append({"type": ContentType.TEXT, "text": execution.result["message"]})
-
-                # Add structured data if present
-                if "data" in execution.result:
-                    data = execution.result["data"]
-                    if isinstance(data, str):
-                        content.append({"type": ContentType.TEXT, "text": data})
-                    elif isinstance(data, dict):
-                        # Structured content for better client processing
-                        structured_content = data
-                        content.append({"type": ContentType.TEXT, "text": str(data)})
-                    else:
-                        content.append({"type": ContentType.TEXT, "text": str(data)})
-
-                # Support for future multi-type results (images, audio, resources)
-                if "image" in execution.result:
-                    image_data = execution.result["image"]
-                    content.append(
-                        {
-                            "type": ContentType.IMAGE,
-                            "data": image_data["data"],
-                            "mimeType": image_data.get("mimeType", "image/png"),
-                        }
-                    )
-
-                if "audio" in execution.result:
-                    audio_data = execution.result["audio"]
-                    content.append(
-                        {
-                            "type": ContentType.AUDIO,
-                            "data": audio_data["data"],
-                            "mimeType": audio_data.get("mimeType", "audio/wav"),
-                        }
-                    )
+            return JSONRPCHandler.create_response(request.id, result.model_dump())
 
-                if "resource" in execution.result:
-                    content.append(
-                        {"type": ContentType.RESOURCE, "resource": execution.result["resource"]}
-                    )
+        except Exception as e:
+            logger.error(event="tool_call_error", error=str(e))
+            return JSONRPCHandler.create_error_response(
+                request.id, MCP_TOOL_EXECUTION_ERROR, f"Tool execution error: {str(e)}"
+            )
 
-                if "resource_link" in execution.result:
-                    link_data = execution.result["resource_link"]
-                    content.append(
-                        {
-                            "type": ContentType.RESOURCE_LINK,
-                            "uri": link_data["uri"],
-                            "name": link_data.get("name"),
-                            "description": link_data.get("description"),
-                            "mimeType": link_data.get("mimeType"),
-                        }
-                    )
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a registered tool and convert its result to MCP content.
 
-                # Create result with structured content support
-                result_data = {"content": content, "isError": False}
+        In-process callers such as the router use this directly instead of
+        wrapping the call in a JSON-RPC request.
 
-                # Add structured content if available (MCP 2025 enhancement)
-                if structured_content:
-                    result_data["structuredContent"] = structured_content
+        Args:
+            name: Tool name
+            arguments: Tool arguments
 
-                result = MCPToolsCallResult.model_validate(result_data)
+        Returns:
+            tools/call result dict with content, isError and, when the tool
+            returned structured data, structuredContent
+        """
+        # Execute tool through registry
+        execution = await self.tool_registry.execute_tool(tool_name=name, arguments=arguments)
+
+        if execution.success:
+            # Convert result to MCP format with multi-type support
+            content = []
+            structured_content = None
+
+            # Add main result as text
+            if "message" in execution.result:
+                content.append({"type": ContentType.TEXT, "text": execution.result["message"]})
+
+            # Add structured data if present
+            if "data" in execution.result:
+                data = execution.result["data"]
+                if isinstance(data, str):
+                    content.append({"type": ContentType.TEXT, "text": data})
+                elif isinstance(data, dict):
+                    # Structured content for better client processing
+                    structured_content = data
+                    content.append({"type": ContentType.TEXT, "text": str(data)})
+                else:
+                    content.append({"type": ContentType.TEXT, "text": str(data)})
+
+            # Support for future multi-type results (images, audio, resources)
+            if "image" in execution.result:
+                image_data = execution.result["image"]
+                content.append(
+                    {
+                        "type": ContentType.IMAGE,
+                        "data": image_data["data"],
+                        "mimeType": image_data.get("mimeType", "image/png"),
+                    }
+                )
 
-                logger.info(
-                    event="tool_executed",
-                    tool_name=params.name,
-                    execution_time_ms=execution.execution_time_ms,
-                    content_types=[c["type"] for c in content],
+            if "audio" in execution.result:
+                audio_data = execution.result["audio"]
+                content.append(
+                    {
+                        "type": ContentType.AUDIO,
+                        "data": audio_data["data"],
+                        "mimeType": audio_data.get("mimeType", "audio/wav"),
+                    }
                 )
 
-            else:
-                # Tool execution failed
-                result = MCPToolsCallResult(
-                    content=[{"type": "text", "text": execution.error or "Tool execution failed"}],
-                    isError=True,
+            if "resource" in execution.result:
+                content.append(
+                    {"type": ContentType.RESOURCE, "resource": execution.result["resource"]}
                 )
 
-                logger.warning(
-                    event="tool_execution_failed", tool_name=params.name, error=execution.error
+            if "resource_link" in execution.result:
+                link_data = execution.result["resource_link"]
+                content.append(
+                    {
+                        "type": ContentType.RESOURCE_LINK,
+                        "uri": link_data["uri"],
+                        "name": link_data.get("name"),
+                        "description": link_data.get("description"),
+                        "mimeType": link_data.get("mimeType"),
+                    }
                 )
 
-            return JSONRPCHandler.create_response(request.id, result.model_dump())
+            # Create result with structured content support
+            result_data = {"content": content, "isError": False}
 
-        except Exception as e:
-            logger.error(event="tool_call_error", error=str(e))
-            return JSONRPCHandler.create_error_response(
-                request.id, MCP_TOOL_EXECUTION_ERROR, f"Tool execution error: {str(e)}"
+            # Add structured content if available (MCP 2025 enhancement)
+            if structured_content:
+                result_data["structuredContent"] = structured_content
+
+            logger.info(
+                event="tool_executed",
+                tool_name=name,
+                execution_time_ms=execution.execution_time_ms,
+                content_types=[c["type"] for c in content],
             )
 
+        else:
+            # Tool execution failed
+            result_data = {
+                "content": [{"type": "text", "text": execution.error or "Tool execution failed"}],
+                "isError": True,
+            }
+
+            logger.warning(event="tool_execution_failed", tool_name=name, error=execution.error)
+
+        return result_data
+
     async def _handle_initialized(self, notification: JSONRPCNotification) -> None:
         """Handle initialized notification from client."""
         # Mark client as initialized (we could track client IDs here)
@@ -497,39 +505,6 @@ class MCP2025Server:
             logger.info(event="request_cancelled", request_id=request_id)
             # Here we would cancel any ongoing operations for this request
 
-    def _convert_tool_parameters_to_schema(self, tool: Tool) -> Dict[str, Any]:
-        """Convert tool parameters to JSON Schema format."""
-        if not tool.parameters:
-            return {"type": "object", "properties": {}, "required": []}
-
-        properties = {}
-        required = []
-
-        for param in tool.parameters:
-            # Convert parameter to JSON Schema
-            prop_schema: Dict[str, Any] = {
-                "type": param.type.value,
-                "description": param.description,
-            }
-
-            if param.enum:
-                prop_schema["enum"] = param.enum
-            if param.minimum is not None:
-                prop_schema["minimum"] = param.minimum
-            if param.maximum is not None:
-                prop_schema["maximum"] = param.maximum
-            if param.pattern:
-                prop_schema["pattern"] = param.pattern
-            if param.default is not None:
-                prop_schema["default"] = param.default
-
-            properties[param.name] = prop_schema
-
-            if param.required:
-                required.append(param.name)
-
-        return {"type": "object", "properties": properties, "required": required}
-
     async def notify_tools_changed(self) -> None:
         """Send tools list changed notification to all connected clients."""
         self.state.tools_version += 1
@@ -604,6 +579,9 @@ class MCP2025Server:
         Raises:
             RuntimeError: If configuration cannot be loaded
         """
+        if self._active_config is not None:
+            return dict(self._active_config)
+
         try:
             # Load configuration if not cached
             if self.config_cache is None:
@@ -634,7 +612,8 @@ class MCP2025Server:
                 parameters=list(result.keys()),
             )
 
-            return result
+            self._active_config = result
+            return dict(result)
 
         except Exception as e:
             logger.error(event="get_active_provider_config_failed", error=str(e))
@@ -680,6 +659,7 @@ class MCP2025Server:
                 self.config_cache["provider"]["models"][provider] = {}
 
             self.config_cache["provider"]["models"][provider][param_name] = validated_value
+            self._active_config = None
 
             # Save to file
             success = self.config_persistence.save_config(self.config_cache)
@@ -692,7 +672,7 @@ class MCP2025Server:
                     event="provider_parameter_updated",
                     provider=provider,
                     parameter=param_name,
-                    old_value=constraint.get("current_value"),
+                    old_value=constraint.current_value,
                     new_value=validated_value,
                 )
 
@@ -712,6 +692,82 @@ class MCP2025Server:
                 raise
             raise RuntimeError(f"Failed to set parameter: {str(e)}")
 
+    async def set_provider_parameters(
+        self, provider: str, params: Dict[str, Any]
+    ) -> Dict[str, bool]:
+        """
+        Update several parameters for a provider in one write.
+
+        All values are validated before any is applied, so an invalid value
+        leaves the configuration untouched. The configuration is saved once
+        and a change notification is sent for each updated parameter.
+
+        Args:
+            provider: Provider name (openai, anthropic, gemini, openrouter)
+            params: Mapping of parameter name to new value
+
+        Returns:
+            Mapping of parameter name to True for each updated parameter
+
+        Raises:
+            ValueError: If provider, a parameter, or a value is invalid
+            RuntimeError: If update fails
+        """
+        try:
+            # Validate provider exists
+            available_providers = await self.get_available_providers()
+            if provider not in available_providers:
+                raise ValueError(f"Invalid provider '{provider}'. Available: {available_providers}")
+
+            # Validate every value before touching the configuration
+            constraints = await self.get_parameter_constraints(provider)
+            validated = {}
+            for param_name, value in params.items():
+                if param_name not in constraints:
+                    raise ValueError(f"Invalid parameter '{param_name}' for provider '{provider}'")
+                validated[param_name] = self._validate_parameter_value(
+                    value, constraints[param_name]
+                )
+
+            if not validated:
+                return {}
+
+            # Update configuration in cache and persist
+            if self.config_cache is None:
+                self.config_cache = self.config_persistence.load_config()
+
+            models = self.config_cache["provider"]["models"]
+            if provider not in models:
+                models[provider] = {}
+            models[provider].update(validated)
+            self._active_config = None
+
+            # Save to file once for the whole batch
+            if not self.config_persistence.save_config(self.config_cache):
+                raise RuntimeError("Configuration update failed")
+
+            for param_name, validated_value in validated.items():
+                await self._notify_configuration_changed(provider, param_name, validated_value)
+
+            logger.info(
+                event="provider_parameters_updated",
+                provider=provider,
+                parameters=list(validated),
+            )
+
+            return dict.fromkeys(validated, True)
+
+        except Exception as e:
+            logger.error(
+                event="set_provider_parameters_failed",
+                provider=provider,
+                parameters=list(params),
+                error=str(e),
+            )
+            if isinstance(e, (ValueError, RuntimeError)):
+                raise
+            raise RuntimeError(f"Failed to set parameters: {str(e)}")
+
     async def switch_active_provider(self, provider: str) -> bool:
         """
         Switch the active provider.
@@ -742,6 +798,7 @@ class MCP2025Server:
 
             # Switch provider
             self.config_cache["provider"]["active"] = provider
+            self._active_config = None
 
             # Save to file
             success = self.config_persistence.save_config(self.config_cache)
@@ -774,11 +831,16 @@ class MCP2025Server:
             provider: Provider name
 
         Returns:
-            Dictionary with available models and their info
+            Dictionary with available models and their info. The result is
+            cached per provider and shared between callers, so treat it as read-only.
 
         Raises:
             ValueError: If provider is invalid
         """
+        cached = self._models_cache.get(provider)
+        if cached is not None:
+            return cached
+
         try:
             # Get models from parameter schemas
             if provider not in PopularModels.PHASE_1_MODELS:
@@ -787,7 +849,11 @@ class MCP2025Server:
             models = PopularModels.PHASE_1_MODELS[provider]
 
             # Format response with model details
-            result = {"provider": provider, "models": []}
+            result = {
+                "provider": provider,
+                "default_model": models[0] if models else None,
+                "models": [],
+            }
 
             for model_name in models:
                 model_info = {
@@ -801,6 +867,8 @@ class MCP2025Server:
                 event="available_models_retrieved", provider=provider, model_count=len(models)
             )
 
+            self._models_cache[provider] = result
+            self._model_names[provider] = frozenset(models)
             return result
 
         except Exception as e:
@@ -809,7 +877,27 @@ class MCP2025Server:
                 raise
             raise RuntimeError(f"Failed to get available models: {str(e)}")
 
-    async def get_parameter_constraints(self, provider: str) -> Dict[str, Any]:
+    async def is_available_model(self, provider: str, model: str) -> bool:
+        """
+        Check whether a model is listed for a provider.
+
+        Args:
+            provider: Provider name
+            model: Model name
+
+        Returns:
+            True if get_available_models lists the model for the provider
+
+        Raises:
+            ValueError: If provider is invalid
+        """
+        names = self._model_names.get(provider)
+        if names is None:
+            await self.get_available_models(provider)
+            names = self._model_names[provider]
+        return model in names
+
+    async def get_parameter_constraints(self, provider: str) -> Dict[str, ParameterInfo]:
         """
         Get parameter constraints for a specific provider.
 
@@ -817,7 +905,7 @@ class MCP2025Server:
             provider: Provider name
 
         Returns:
-            Dictionary with parameter constraints and current values
+            Dictionary mapping parameter names to constraints with current values
 
         Raises:
             ValueError: If provider is invalid
@@ -835,16 +923,16 @@ class MCP2025Server:
             for param_name, constraint in schema.items():
                 current_value = current_config.get(param_name, constraint.default)
 
-                constraints[param_name] = {
-                    "type": constraint.param_type.value,
-                    "description": constraint.description,
-                    "min_value": constraint.min_value,
-                    "max_value": constraint.max_value,
-                    "enum_values": constraint.enum_values,
-                    "default": constraint.default,
-                    "current_value": current_value,
-                    "required": constraint.required,
-                }
+                constraints[param_name] = ParameterInfo(
+                    type=constraint.param_type.value,
+                    description=constraint.description,
+                    min_value=constraint.min_value,
+                    max_value=constraint.max_value,
+                    enum_values=constraint.enum_values,
+                    default=constraint.default,
+                    current_value=current_value,
+                    required=constraint.required,
+                )
 
             logger.debug(
                 event="parameter_constraints_retrieved",
@@ -861,6 +949,55 @@ class MCP2025Server:
                 raise
             raise RuntimeError(f"Failed to get parameter constraints: {str(e)}")
 
+    async def has_parameter(self, provider: str, param_name: str) -> bool:
+        """
+        Check whether a parameter exists for a provider and the active model.
+
+        Reads the static schema only, without building the constraints.
+
+        Args:
+            provider: Provider name
+            param_name: Parameter name
+
+        Returns:
+            True if get_parameter_constraints would include the parameter
+        """
+        current_config = await self.get_active_provider_config()
+        model = current_config.get("model", "")
+        return param_name in ModelParameterSchemas.get_model_schema(provider, model)
+
+    async def get_parameter_values(self, provider: str) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Get current and default values for a provider's parameters.
+
+        A lighter alternative to get_parameter_constraints for callers that
+        only need the values, not the full constraint details.
+
+        Args:
+            provider: Provider name
+
+        Returns:
+            Dictionary mapping parameter names to (current_value, default) tuples
+
+        Raises:
+            ValueError: If provider is invalid
+        """
+        try:
+            current_config = await self.get_active_provider_config()
+            model = current_config.get("model", "")
+            schema = ModelParameterSchemas.get_model_schema(provider, model)
+
+            return {
+                param_name: (current_config.get(param_name, constraint.default), constraint.default)
+                for param_name, constraint in schema.items()
+            }
+
+        except Exception as e:
+            logger.error(event="get_parameter_values_failed", provider=provider, error=str(e))
+            if isinstance(e, ValueError):
+                raise
+            raise RuntimeError(f"Failed to get parameter values: {str(e)}")
+
     async def reset_to_defaults(self, provider: str) -> bool:
         """
         Reset provider configuration to defaults.
@@ -886,8 +1023,8 @@ class MCP2025Server:
             defaults = {}
 
             for param_name, constraint in constraints.items():
-                if constraint["default"] is not None:
-                    defaults[param_name] = constraint["default"]
+                if constraint.default is not None:
+                    defaults[param_name] = constraint.default
 
             # Load configuration if not cached
             if self.config_cache is None:
@@ -913,6 +1050,7 @@ class MCP2025Server:
 
             # Save configuration if any defaults were applied
             if success_count > 0:
+                self._active_config = None
                 success = self.config_persistence.save_config(self.config_cache)
                 if not success:
                     raise RuntimeError("Failed to save configuration")
@@ -947,13 +1085,13 @@ class MCP2025Server:
         """
         return list(PopularModels.PHASE_1_MODELS.keys())
 
-    def _validate_parameter_value(self, value: Any, constraint: Dict[str, Any]) -> Any:
+    def _validate_parameter_value(self, value: Any, constraint: ParameterInfo) -> Any:
         """
         Validate a parameter value against its constraints.
 
         Args:
             value: Value to validate
-            constraint: Constraint dictionary
+            constraint: Parameter constraint
 
         Returns:
             Validated value
@@ -963,7 +1101,7 @@ class MCP2025Server:
         """
         try:
             # Type validation
-            param_type = constraint["type"]
+            param_type = constraint.type
             if param_type == "integer" and not isinstance(value, int):
                 if isinstance(value, float) and value.is_integer():
                     value = int(value)
@@ -975,19 +1113,17 @@ class MCP2025Server:
                 raise ValueError(f"Expected string, got {type(value).__name__}")
 
             # Range validation
-            if constraint["min_value"] is not None and isinstance(value, (int, float)):
-                if value < constraint["min_value"]:
-                    raise ValueError(f"Value {value} below minimum {constraint['min_value']}")
+            if constraint.min_value is not None and isinstance(value, (int, float)):
+                if value < constraint.min_value:
+                    raise ValueError(f"Value {value} below minimum {constraint.min_value}")
 
-            if constraint["max_value"] is not None and isinstance(value, (int, float)):
-                if value > constraint["max_value"]:
-                    raise ValueError(f"Value {value} above maximum {constraint['max_value']}")
+            if constraint.max_value is not None and isinstance(value, (int, float)):
+                if value > constraint.max_value:
+                    raise ValueError(f"Value {value} above maximum {constraint.max_value}")
 
             # Enum validation
-            if constraint["enum_values"] and value not in constraint["enum_values"]:
-                raise ValueError(
-                    f"Value {value} not in allowed values: {constraint['enum_values']}"
-                )
+            if constraint.enum_values and value not in constraint.enum_values:
+                raise ValueError(f"Value {value} not in allowed values: {constraint.enum_values}")
 
             return value
 
@@ -995,7 +1131,7 @@ class MCP2025Server:
             logger.error(
                 event="parameter_validation_failed",
                 value=value,
-                constraint=constraint,
+                constraint=constraint.to_dict(),
                 error=str(e),
             )
             raise ValueError(f"Parameter validation failed: {str(e)}")
@@ -6,7 +6,7 @@ including constraints, defaults, and model-specific variations.
 """
 
 from typing import Dict, Any, Optional, List, Union
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from enum import Enum
 
 
@@ -36,6 +36,24 @@ class ParameterConstraint:
     description: str = ""
 
 
+@dataclass(slots=True, frozen=True)
+class ParameterInfo:
+    """Parameter constraint resolved against the current configuration value."""
+
+    type: str
+    description: str
+    min_value: Optional[Union[float, int]]
+    max_value: Optional[Union[float, int]]
+    enum_values: Optional[List[str]]
+    default: Optional[Any]
+    current_value: Any
+    required: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for JSON output."""
+        return asdict(self)
+
+
 class ModelParameterSchemas:
     """Comprehensive parameter schemas for all supported models."""
 
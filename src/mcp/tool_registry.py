@@ -65,6 +65,40 @@ class Tool(BaseModel):
         arbitrary_types_allowed = True
 
 
+def tool_input_schema(tool: Tool) -> Dict[str, Any]:
+    """Convert tool parameters to JSON Schema format."""
+    if not tool.parameters:
+        return {"type": "object", "properties": {}, "required": []}
+
+    properties = {}
+    required = []
+
+    for param in tool.parameters:
+        # Convert parameter to JSON Schema
+        prop_schema: Dict[str, Any] = {
+            "type": param.type.value,
+            "description": param.description,
+        }
+
+        if param.enum:
+            prop_schema["enum"] = param.enum
+        if param.minimum is not None:
+            prop_schema["minimum"] = param.minimum
+        if param.maximum is not None:
+            prop_schema["maximum"] = param.maximum
+        if param.pattern:
+            prop_schema["pattern"] = param.pattern
+        if param.default is not None:
+            prop_schema["default"] = param.default
+
+        properties[param.name] = prop_schema
+
+        if param.required:
+            required.append(param.name)
+
+    return {"type": "object", "properties": properties, "required": required}
+
+
 @dataclass
 class ToolExecution:
     """Result of tool execution."""
@@ -100,12 +134,19 @@ class ToolRegistry:
         """Initialize the tool registry."""
         self.tools: Dict[str, Tool] = {}
         self.handlers: Dict[str, ToolHandler] = {}
+        # MCP-format definition (name, description, inputSchema) per tool, built at registration
+        self.mcp_tools: Dict[str, Dict[str, Any]] = {}
 
         logger.info(event="tool_registry_initialized", builtin_tools=list(self.tools.keys()))
 
     async def register_tool(self, tool: Tool) -> None:
         """Register a tool definition."""
         self.tools[tool.name] = tool
+        self.mcp_tools[tool.name] = {
+            "name": tool.name,
+            "description": tool.description,
+            "inputSchema": tool_input_schema(tool),
+        }
 
         logger.info(
             event="tool_registered",
@@ -130,6 +171,7 @@ class ToolRegistry:
         """Unregister a tool."""
         if tool_name in self.tools:
             del self.tools[tool_name]
+            del self.mcp_tools[tool_name]
             if tool_name in self.handlers:
                 del self.handlers[tool_name]
 
@@ -142,6 +184,15 @@ class ToolRegistry:
         """List all registered tools."""
         return list(self.tools.values())
 
+    async def list_mcp_tools(self) -> List[Dict[str, Any]]:
+        """
+        List all registered tools in MCP format.
+
+        The definitions are built once at registration and shared; callers
+        must treat them as read-only.
+        """
+        return list(self.mcp_tools.values())
+
     async def get_tool(self, tool_name: str) -> Optional[Tool]:
         """Get a specific tool definition."""
         return self.tools.get(tool_name)
@@ -0,0 +1,17 @@
+"""
+Error types raised inside MCP configuration tools.
+
+Tools raise these from their inner execution path and convert them to
+structured error results at the execute() boundary.
+"""
+
+from typing import Iterable
+
+
+class ProviderNotFoundError(LookupError):
+    """Requested provider is not one of the available providers."""
+
+    def __init__(self, provider: str, available: Iterable[str]):
+        self.provider = provider
+        self.available = list(available)
+        super().__init__(f"Provider '{provider}' not found")
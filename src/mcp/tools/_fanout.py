@@ -0,0 +1,39 @@
+"""
+Concurrent per-provider calls for MCP configuration tools.
+
+Several tools call the same MCP server method once per provider. The calls
+are independent, so they are issued concurrently and collected into a dict
+keyed by provider, in the order the providers were given.
+"""
+
+import asyncio
+from typing import Any, Dict, Iterable
+
+
+async def fanout(mcp_server, method: str, providers: Iterable[str]) -> Dict[str, Any]:
+    """
+    Call an MCP server method for each provider concurrently.
+
+    Args:
+        mcp_server: MCP server instance exposing the method
+        method: Name of an async method taking the provider name
+        providers: Providers to call the method for
+
+    Returns:
+        Mapping of provider to the method result, or {"error": message}
+        if the call raised
+    """
+    providers = list(providers)
+    call = getattr(mcp_server, method)
+    results = await asyncio.gather(
+        *(asyncio.create_task(call(provider)) for provider in providers),
+        return_exceptions=True,
+    )
+
+    fanned_out: Dict[str, Any] = {}
+    for provider, result in zip(providers, results, strict=True):
+        if isinstance(result, Exception):
+            fanned_out[provider] = {"error": str(result)}
+        else:
+            fanned_out[provider] = result
+    return fanned_out
@@ -0,0 +1,30 @@
+"""
+Shared rendering helpers for MCP configuration tools.
+
+Tools build their text output as line generators and join the lines once.
+"""
+
+from typing import Dict
+
+# Provider header strings, built once per provider name
+_PROVIDER_HEADERS: Dict[str, str] = {}
+_PROVIDER_HEADERS_ACTIVE: Dict[str, str] = {}
+_PROVIDER_LABELS: Dict[str, str] = {}
+
+
+def provider_header(provider: str, active: bool = False) -> str:
+    """Return the "📦 PROVIDER" section header, suffixed with "(active)" if requested."""
+    cache = _PROVIDER_HEADERS_ACTIVE if active else _PROVIDER_HEADERS
+    header = cache.get(provider)
+    if header is None:
+        header = f"📦 {provider.upper()} (active)" if active else f"📦 {provider.upper()}"
+        cache[provider] = header
+    return header
+
+
+def provider_label(provider: str) -> str:
+    """Return the "📦 PROVIDER:" label used in per-provider listings."""
+    label = _PROVIDER_LABELS.get(provider)
+    if label is None:
+        label = _PROVIDER_LABELS[provider] = f"📦 {provider.upper()}:"
+    return label
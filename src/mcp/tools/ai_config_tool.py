@@ -103,7 +103,7 @@ class AIConfigurationTool(ToolHandler):
                 # Get default value for this parameter
                 constraints = await self.mcp_server.get_parameter_constraints(provider)
                 if parameter in constraints:
-                    value = constraints[parameter]["default"]
+                    value = constraints[parameter].default
                 else:
                     return {
                         "message": f"Unknown parameter '{parameter}' for provider '{provider}'",
@@ -113,7 +113,7 @@ class AIConfigurationTool(ToolHandler):
                 # Parse value based on parameter type
                 constraints = await self.mcp_server.get_parameter_constraints(provider)
                 if parameter in constraints:
-                    param_type = constraints[parameter]["type"]
+                    param_type = constraints[parameter].type
                     if param_type == "number":
                         try:
                             value = float(value_str)
@@ -11,13 +11,20 @@ Standard MCP Tool: list_available_models
 - Shows model support status
 """
 
-from typing import Dict, Any
+import asyncio
+import time
+from typing import Dict, Any, Iterator, List
 
 from ..tool_registry import ToolHandler, Tool, ToolParameter, ToolParameterType
+from ._errors import ProviderNotFoundError
+from ._fanout import fanout
+from ._render import provider_header
 from common.logging import get_logger
 
 logger = get_logger(__name__)
 
+_EQ50 = "=" * 50
+
 
 class ListModelsTool(ToolHandler):
     """
@@ -75,147 +82,199 @@ class ListModelsTool(ToolHandler):
             List of available models with their status
         """
         try:
-            filter_provider = arguments.get("provider")
-            output_format = arguments.get("format", "grouped")
-
-            logger.info(
-                event="list_models_tool_executed",
-                filter_provider=filter_provider,
-                format=output_format,
-            )
-
-            # Get current configuration to identify active model
-            current_config = await self.mcp_server.get_active_provider_config()
-            active_provider = current_config.get("provider")
-            active_model = current_config.get("model")
-
-            # Get list of available providers
-            providers = await self.mcp_server.get_available_providers()
-
-            # Filter providers if requested
-            if filter_provider:
-                if filter_provider in providers:
-                    providers = [filter_provider]
-                else:
-                    return {
-                        "status": "error",
-                        "error": f"Provider '{filter_provider}' not found",
-                        "message": f"Available providers: {', '.join(providers)}",
-                        "tool": "list_available_models",
-                    }
-
-            # Collect models for each provider
-            all_models = {}
-            total_count = 0
-
-            for provider in providers:
-                models_info = await self.mcp_server.get_available_models(provider)
-                all_models[provider] = models_info["models"]
-                total_count += len(models_info["models"])
-
-            # Format output based on requested format
-            if output_format == "json":
-                # Raw JSON format
-                formatted_output = {
-                    "providers": {},
-                    "active": {
-                        "provider": active_provider,
-                        "model": active_model,
-                    },
-                }
-
-                for provider, models in all_models.items():
-                    formatted_output["providers"][provider] = [
-                        {
-                            "name": model["name"],
-                            "supported": model["supported"],
-                            "active": (
-                                provider == active_provider and model["name"] == active_model
-                            ),
-                        }
-                        for model in models
-                    ]
-
-            elif output_format == "flat":
-                # Flat list format
-                lines = [
-                    "Available AI Models:",
-                    f"Active: {active_provider}/{active_model}",
-                    "",
-                ]
-
-                for provider, models in all_models.items():
-                    for model in models:
-                        is_active = provider == active_provider and model["name"] == active_model
-                        status = " ✓" if is_active else ""
-                        lines.append(f"  {provider}/{model['name']}{status}")
-
-                formatted_output = "\n".join(lines)
-
-            else:  # grouped format
-                # Grouped by provider format
-                lines = [
-                    "🤖 Available AI Models",
-                    "=" * 50,
-                    f"Current: {active_provider} - {active_model}",
-                    "",
-                ]
-
-                for provider, models in all_models.items():
-                    is_active_provider = provider == active_provider
-                    provider_header = f"📦 {provider.upper()}"
-                    if is_active_provider:
-                        provider_header += " (active)"
-
-                    lines.append(provider_header)
-                    lines.append("-" * len(provider_header))
-
-                    for model in models:
-                        is_active = is_active_provider and model["name"] == active_model
-                        status = ""
-                        if is_active:
-                            status = " ✓ (current)"
-                        elif not model["supported"]:
-                            status = " ⚠️ (limited support)"
-
-                        lines.append(f"  • {model['name']}{status}")
+            return await self._execute_inner(arguments)
 
-                    lines.append("")
-
-                lines.append(f"Total: {total_count} models across {len(all_models)} providers")
-                lines.append("")
-                lines.append("💡 Use 'switch_provider' to change providers")
-
-                formatted_output = "\n".join(lines)
-
-            result = {
-                "status": "success",
-                "models": formatted_output if isinstance(formatted_output, str) else None,
-                "data": formatted_output if isinstance(formatted_output, dict) else None,
-                "message": f"Found {total_count} models across {len(all_models)} providers",
-                "active_provider": active_provider,
-                "active_model": active_model,
+        except ProviderNotFoundError as e:
+            error = str(e)
+            logger.warning(event="list_models_tool_error", error=error)
+            return {
+                "status": "error",
+                "error": error,
+                "message": f"Available providers: {', '.join(e.available)}",
                 "tool": "list_available_models",
             }
 
-            logger.info(
-                event="list_models_completed",
-                total_models=total_count,
-                providers_count=len(all_models),
-                format=output_format,
-            )
-
-            return result
+        except (LookupError, ValueError, RuntimeError, TimeoutError, ConnectionError) as e:
+            error = str(e)
+            logger.error(event="list_models_tool_error", error=error)
 
         except Exception as e:
+            # Unexpected failure - keep the traceback in the log
+            error = str(e)
+            logger.exception(event="list_models_tool_error", error=error)
+
+        return {
+            "status": "error",
+            "error": error,
+            "message": f"Failed to list models: {error}",
+            "tool": "list_available_models",
+        }
+
+    async def _execute_inner(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect and format available models; raises on failure."""
+        start_time = time.perf_counter()
+        filter_provider = arguments.get("provider")
+        output_format = arguments.get("format", "grouped")
+
+        # Get current configuration (to identify the active model) and the
+        # available providers concurrently
+        current_config, providers = await asyncio.gather(
+            self.mcp_server.get_active_provider_config(),
+            self.mcp_server.get_available_providers(),
+        )
+        active_provider = current_config.get("provider")
+        active_model = current_config.get("model")
+
+        # Ordered list for output, set for lookups
+        providers_list = list(providers)
+        providers_set = frozenset(providers_list)
+
+        # Filter providers if requested
+        if filter_provider:
+            if filter_provider not in providers_set:
+                raise ProviderNotFoundError(filter_provider, providers_list)
+            providers_list = [filter_provider]
+
+        # Collect models for each provider concurrently
+        all_models = {}
+        total_count = 0
+        provider_errors: Dict[str, str] = {}
+
+        models_by_provider = await fanout(self.mcp_server, "get_available_models", providers_list)
+        for provider, models_info in models_by_provider.items():
+            if "error" in models_info:
+                provider_errors[provider] = models_info["error"]
+                continue
+            all_models[provider] = models_info["models"]
+            total_count += len(models_info["models"])
+
+        # Nothing to list when the requested provider (or every provider) failed
+        if provider_errors and not all_models:
+            error = "; ".join(f"{provider}: {err}" for provider, err in provider_errors.items())
             logger.error(
                 event="list_models_tool_error",
-                error=str(e),
+                filter_provider=filter_provider,
+                errors=provider_errors,
             )
-
             return {
                 "status": "error",
-                "error": str(e),
-                "message": f"Failed to list models: {str(e)}",
+                "error": error,
+                "errors": provider_errors,
+                "message": f"Failed to list models: {error}",
                 "tool": "list_available_models",
             }
+
+        # Format output based on requested format
+        if output_format == "json":
+            # Raw JSON format
+            formatted_output = {
+                "providers": {},
+                "active": {
+                    "provider": active_provider,
+                    "model": active_model,
+                },
+            }
+
+            for provider, models in all_models.items():
+                is_active_provider = provider == active_provider
+                formatted_output["providers"][provider] = [
+                    {
+                        "name": (name := model["name"]),
+                        "supported": model["supported"],
+                        "active": is_active_provider and name == active_model,
+                    }
+                    for model in models
+                ]
+
+        elif output_format == "flat":
+            formatted_output = _render_flat(all_models, active_provider, active_model)
+
+        else:  # grouped format
+            formatted_output = _render_grouped(
+                all_models, active_provider, active_model, total_count
+            )
+
+        if not isinstance(formatted_output, dict):
+            formatted_output = "\n".join(formatted_output)
+
+        message = f"Found {total_count} models across {len(all_models)} providers"
+        if provider_errors:
+            message += f" (failed to list models for: {', '.join(provider_errors)})"
+
+        result = {
+            "status": "success",
+            "message": message,
+            "active_provider": active_provider,
+            "active_model": active_model,
+            "tool": "list_available_models",
+        }
+        if provider_errors:
+            result["errors"] = provider_errors
+        # Only the key matching the produced output is included
+        if isinstance(formatted_output, str):
+            result["models"] = formatted_output
+        else:
+            result["data"] = formatted_output
+
+        # Single summary event per call
+        logger.info(
+            event="list_models_completed",
+            filter_provider=filter_provider,
+            format=output_format,
+            total_models=total_count,
+            providers_count=len(all_models),
+            errors=provider_errors,
+            elapsed_ms=round((time.perf_counter() - start_time) * 1000, 2),
+        )
+
+        return result
+
+
+def _render_flat(
+    all_models: Dict[str, List[Dict[str, Any]]], active_provider: str, active_model: str
+) -> Iterator[str]:
+    """Yield the lines of the flat model list."""
+    yield "Available AI Models:"
+    yield f"Active: {active_provider}/{active_model}"
+    yield ""
+
+    for provider, models in all_models.items():
+        for model in models:
+            is_active = provider == active_provider and model["name"] == active_model
+            status = " ✓" if is_active else ""
+            yield f"  {provider}/{model['name']}{status}"
+
+
+def _render_grouped(
+    all_models: Dict[str, List[Dict[str, Any]]],
+    active_provider: str,
+    active_model: str,
+    total_count: int,
+) -> Iterator[str]:
+    """Yield the lines of the model list grouped by provider."""
+    yield "🤖 Available AI Models"
+    yield _EQ50
+    yield f"Current: {active_provider} - {active_model}"
+    yield ""
+
+    for provider, models in all_models.items():
+        is_active_provider = provider == active_provider
+        header = provider_header(provider, is_active_provider)
+        yield header
+        yield "-" * len(header)
+
+        for model in models:
+            is_active = is_active_provider and model["name"] == active_model
+            status = ""
+            if is_active:
+                status = " ✓ (current)"
+            elif not model["supported"]:
+                status = " ⚠️ (limited support)"
+
+            yield f"  • {model['name']}{status}"
+
+        yield ""
+
+    yield f"Total: {total_count} models across {len(all_models)} providers"
+    yield ""
+    yield "💡 Use 'switch_provider' to change providers"
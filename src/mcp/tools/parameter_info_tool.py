@@ -11,13 +11,23 @@ Standard MCP Tool: get_parameter_info
 - Shows provider-specific differences
 """
 
-from typing import Dict, Any
+import asyncio
+import time
+from typing import Dict, Any, Iterator, List, Tuple, Union
 
+from ..parameter_schemas import ParameterInfo
 from ..tool_registry import ToolHandler, Tool, ToolParameter, ToolParameterType
+from ._errors import ProviderNotFoundError
+from ._fanout import fanout
+from ._render import provider_label
 from common.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Row templates for the all-parameters listing
+_PARAM_ROW = "• %s:\n  Description: %s\n  Type: %s\n  Current: %s %s"
+_RANGE_ROW = "  Range: %s - %s"
+
 
 class ParameterInfoTool(ToolHandler):
     """
@@ -80,198 +90,240 @@ class ParameterInfoTool(ToolHandler):
             Detailed parameter information
         """
         try:
-            param_name = arguments.get("parameter")
-            specified_provider = arguments.get("provider")
-            compare_providers = arguments.get("compare", False)
-
-            logger.info(
-                event="parameter_info_tool_executed",
-                parameter=param_name,
-                provider=specified_provider,
-                compare=compare_providers,
+            return await self._execute_inner(arguments)
+
+        except ProviderNotFoundError as e:
+            error = str(e)
+            logger.warning(
+                event="parameter_info_tool_error", error=error, parameter=arguments.get("parameter")
             )
+            return {
+                "status": "error",
+                "error": error,
+                "message": f"Available providers: {', '.join(e.available)}",
+                "tool": "get_parameter_info",
+            }
 
-            # Get current configuration to determine default provider
-            current_config = await self.mcp_server.get_active_provider_config()
-            current_provider = current_config.get("provider")
+        except (LookupError, ValueError, RuntimeError, TimeoutError, ConnectionError) as e:
+            error = str(e)
+            logger.error(
+                event="parameter_info_tool_error", error=error, parameter=arguments.get("parameter")
+            )
 
-            # Determine which provider(s) to get info for
-            if compare_providers:
-                providers = await self.mcp_server.get_available_providers()
-            else:
-                providers = [specified_provider or current_provider]
-
-            # Collect parameter info for each provider
-            all_info = {}
-            for provider in providers:
-                try:
-                    constraints = await self.mcp_server.get_parameter_constraints(provider)
-
-                    if param_name:
-                        # Filter to specific parameter
-                        if param_name in constraints:
-                            all_info[provider] = {param_name: constraints[param_name]}
-                        else:
-                            # Parameter not found for this provider
-                            all_info[provider] = {}
-                    else:
-                        # All parameters
-                        all_info[provider] = constraints
-                except Exception as e:
-                    logger.warning(
-                        event="parameter_info_provider_error",
-                        provider=provider,
-                        error=str(e),
-                    )
-                    all_info[provider] = {"error": str(e)}
-
-            # Format output
-            if param_name and not compare_providers:
-                # Single parameter, single provider
-                provider = providers[0]
-                if provider in all_info and param_name in all_info[provider]:
-                    param_info = all_info[provider][param_name]
-
-                    lines = [
-                        f"📊 Parameter: {param_name}",
-                        "=" * 50,
-                        f"Provider: {provider}",
-                        "",
-                        f"Description: {param_info['description']}",
-                        f"Type: {param_info['type']}",
-                        f"Current Value: {param_info['current_value']}",
-                        f"Default: {param_info['default']}",
-                    ]
-
-                    if param_info["min_value"] is not None or param_info["max_value"] is not None:
-                        lines.append(
-                            f"Range: {param_info['min_value']} - {param_info['max_value']}"
-                        )
-
-                    if param_info["enum_values"]:
-                        lines.append(f"Valid Options: {', '.join(param_info['enum_values'])}")
-
-                    if param_info["required"]:
-                        lines.append("Required: Yes")
+        except Exception as e:
+            # Unexpected failure - keep the traceback in the log
+            error = str(e)
+            logger.exception(
+                event="parameter_info_tool_error", error=error, parameter=arguments.get("parameter")
+            )
 
-                    lines.append("")
-                    lines.append("💡 Use 'ai_configure' to modify this parameter")
+        return {
+            "status": "error",
+            "error": error,
+            "message": f"Failed to get parameter info: {error}",
+            "tool": "get_parameter_info",
+        }
+
+    async def _execute_inner(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect and format parameter information; raises on failure."""
+        start_time = time.perf_counter()
+        param_name = arguments.get("parameter")
+        specified_provider = arguments.get("provider")
+        compare_providers = arguments.get("compare", False)
+
+        # Get current configuration to determine default provider, together
+        # with the available providers when comparing or validating
+        if compare_providers or specified_provider:
+            current_config, available = await asyncio.gather(
+                self.mcp_server.get_active_provider_config(),
+                self.mcp_server.get_available_providers(),
+            )
+        else:
+            current_config = await self.mcp_server.get_active_provider_config()
+            available = None
+        current_provider = current_config.get("provider")
+
+        # Determine which provider(s) to get info for
+        if compare_providers:
+            providers = list(available)
+        else:
+            if specified_provider and specified_provider not in frozenset(available):
+                raise ProviderNotFoundError(specified_provider, available)
+            providers = [specified_provider or current_provider]
+
+        # Skip the constraints fetch when the server's schema shows the
+        # parameter does not exist for this provider/model
+        provider_errors: List[Tuple[str, str]] = []
+        if (
+            param_name
+            and not compare_providers
+            and not await self.mcp_server.has_parameter(providers[0], param_name)
+        ):
+            # Formats as "not found" below
+            all_info = {providers[0]: {}}
+        else:
+            # Collect parameter info for each provider concurrently
+            all_info = await fanout(self.mcp_server, "get_parameter_constraints", providers)
+            for provider, constraints in all_info.items():
+                if "error" in constraints:
+                    provider_errors.append((provider, constraints["error"]))
+                    continue
 
-                    formatted_output = "\n".join(lines)
-                else:
-                    formatted_output = (
-                        f"Parameter '{param_name}' not found for provider '{provider}'"
+                if param_name:
+                    # Filter to specific parameter (empty if not found for this provider)
+                    all_info[provider] = (
+                        {param_name: constraints[param_name]} if param_name in constraints else {}
                     )
 
-            elif compare_providers:
-                # Compare across providers
+        # Format output
+        if param_name and not compare_providers:
+            # Single parameter, single provider
+            provider = providers[0]
+            if provider in all_info and param_name in all_info[provider]:
+                param_info = all_info[provider][param_name]
+
                 lines = [
-                    f"📊 Parameter Comparison: {param_name or 'All Parameters'}",
+                    f"📊 Parameter: {param_name}",
                     "=" * 50,
+                    f"Provider: {provider}",
                     "",
+                    f"Description: {param_info.description}",
+                    f"Type: {param_info.type}",
+                    f"Current Value: {param_info.current_value}",
+                    f"Default: {param_info.default}",
                 ]
 
-                if param_name:
-                    # Compare single parameter across providers
+                if param_info.min_value is not None or param_info.max_value is not None:
+                    lines.append(f"Range: {param_info.min_value} - {param_info.max_value}")
+
+                if param_info.enum_values:
+                    lines.append(f"Valid Options: {', '.join(param_info.enum_values)}")
+
+                if param_info.required:
+                    lines.append("Required: Yes")
+
+                lines.append("")
+                lines.append("💡 Use 'ai_configure' to modify this parameter")
+
+                formatted_output = "\n".join(lines)
+            else:
+                formatted_output = f"Parameter '{param_name}' not found for provider '{provider}'"
+
+        elif compare_providers:
+            # Compare across providers
+            lines = [
+                f"📊 Parameter Comparison: {param_name or 'All Parameters'}",
+                "=" * 50,
+                "",
+            ]
+
+            if param_name:
+                # Compare single parameter across providers
+                for provider, info in all_info.items():
+                    if "error" in info:
+                        lines.append(f"{provider}: Error - {info['error']}")
+                    elif param_name in info:
+                        param_info = info[param_name]
+                        lines.append(provider_label(provider))
+                        lines.append(f"  Range: {param_info.min_value} - {param_info.max_value}")
+                        lines.append(f"  Default: {param_info.default}")
+                        lines.append(f"  Current: {param_info.current_value}")
+                    else:
+                        lines.append(f"{provider}: Parameter not available")
+                    lines.append("")
+            else:
+                # Compare all parameters
+                for param in _sorted_param_names(all_info):
+                    lines.append(f"• {param}:")
                     for provider, info in all_info.items():
-                        if "error" in info:
-                            lines.append(f"{provider}: Error - {info['error']}")
-                        elif param_name in info:
-                            param_info = info[param_name]
-                            lines.append(f"📦 {provider.upper()}:")
+                        if "error" not in info and param in info:
+                            param_info = info[param]
                             lines.append(
-                                f"  Range: {param_info['min_value']} - {param_info['max_value']}"
+                                f"  {provider}: {param_info.min_value} - {param_info.max_value} (default: {param_info.default})"
                             )
-                            lines.append(f"  Default: {param_info['default']}")
-                            lines.append(f"  Current: {param_info['current_value']}")
-                        else:
-                            lines.append(f"{provider}: Parameter not available")
-                        lines.append("")
-                else:
-                    # Compare all parameters
-                    # First collect all unique parameters
-                    all_params = set()
-                    for info in all_info.values():
-                        if isinstance(info, dict) and "error" not in info:
-                            all_params.update(info.keys())
-
-                    for param in sorted(all_params):
-                        lines.append(f"• {param}:")
-                        for provider, info in all_info.items():
-                            if "error" not in info and param in info:
-                                param_info = info[param]
-                                lines.append(
-                                    f"  {provider}: {param_info['min_value']} - {param_info['max_value']} (default: {param_info['default']})"
-                                )
-                        lines.append("")
+                    lines.append("")
 
-                formatted_output = "\n".join(lines)
+            formatted_output = "\n".join(lines)
+
+        else:
+            # All parameters for single provider
+            provider = providers[0]
+            info = all_info[provider]
 
+            if "error" in info:
+                formatted_output = f"Error getting parameters for {provider}: {info['error']}"
             else:
-                # All parameters for single provider
-                provider = providers[0]
-                info = all_info[provider]
-
-                if "error" in info:
-                    formatted_output = f"Error getting parameters for {provider}: {info['error']}"
-                else:
-                    lines = [
-                        f"📊 All Parameters for {provider.upper()}",
-                        "=" * 50,
-                        "",
-                    ]
-
-                    for param_name, param_info in info.items():
-                        lines.append(f"• {param_name}:")
-                        lines.append(f"  Description: {param_info['description']}")
-                        lines.append(f"  Type: {param_info['type']}")
-                        lines.append(
-                            f"  Current: {param_info['current_value']} {'(default)' if param_info['current_value'] == param_info['default'] else '(modified)'}"
-                        )
-
-                        if (
-                            param_info["min_value"] is not None
-                            or param_info["max_value"] is not None
-                        ):
-                            lines.append(
-                                f"  Range: {param_info['min_value']} - {param_info['max_value']}"
-                            )
+                formatted_output = "\n".join(_render_all_parameters(provider, info))
+
+        result = {
+            "status": "success",
+            "message": "Parameter information retrieved successfully",
+            "tool": "get_parameter_info",
+            "parameter_info": formatted_output,
+        }
+
+        # Single summary event per call
+        logger.info(
+            event="parameter_info_completed",
+            parameter=param_name,
+            provider=specified_provider,
+            compare=compare_providers,
+            providers_count=len(providers),
+            errors=provider_errors,
+            elapsed_ms=round((time.perf_counter() - start_time) * 1000, 2),
+        )
 
-                        if param_info["enum_values"]:
-                            lines.append(f"  Options: {', '.join(param_info['enum_values'])}")
+        return result
 
-                        lines.append("")
 
-                    lines.append("💡 Use 'ai_configure' to modify these parameters")
+def _render_all_parameters(provider: str, info: Dict[str, ParameterInfo]) -> Iterator[str]:
+    """Yield the lines describing every parameter for a single provider."""
+    yield f"📊 All Parameters for {provider.upper()}"
+    yield "=" * 50
+    yield ""
 
-                    formatted_output = "\n".join(lines)
+    for param_name, param_info in info.items():
+        current_value = param_info.current_value
+        yield _PARAM_ROW % (
+            param_name,
+            param_info.description,
+            param_info.type,
+            current_value,
+            "(default)" if current_value == param_info.default else "(modified)",
+        )
 
-            result = {
-                "status": "success",
-                "parameter_info": formatted_output,
-                "message": "Parameter information retrieved successfully",
-                "tool": "get_parameter_info",
-            }
+        min_value = param_info.min_value
+        max_value = param_info.max_value
+        if min_value is not None or max_value is not None:
+            yield _RANGE_ROW % (min_value, max_value)
 
-            logger.info(
-                event="parameter_info_completed",
-                parameter=param_name,
-                providers_count=len(providers),
-                compare=compare_providers,
-            )
+        if param_info.enum_values:
+            yield f"  Options: {', '.join(param_info.enum_values)}"
 
-            return result
+        yield ""
 
-        except Exception as e:
-            logger.error(
-                event="parameter_info_tool_error",
-                error=str(e),
-                parameter=arguments.get("parameter"),
-            )
+    yield "💡 Use 'ai_configure' to modify these parameters"
 
-            return {
-                "status": "error",
-                "error": str(e),
-                "message": f"Failed to get parameter info: {str(e)}",
-                "tool": "get_parameter_info",
+
+def _sorted_param_names(
+    all_info: Dict[str, Dict[str, Union[ParameterInfo, str]]],
+) -> Tuple[str, ...]:
+    """
+    Return the sorted union of parameter names across providers without errors.
+
+    Args:
+        all_info: Constraints per provider, or {"error": message} for a failed provider
+
+    Returns:
+        Sorted parameter names
+    """
+    return tuple(
+        sorted(
+            {
+                name
+                for info in all_info.values()
+                if isinstance(info, dict) and "error" not in info
+                for name in info
             }
+        )
+    )
@@ -11,14 +11,73 @@ Standard MCP Tool: reset_config
 - Shows before/after comparison
 """
 
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, Iterator, NamedTuple, Optional, Tuple, Union
 
 from ..tool_registry import ToolHandler, Tool, ToolParameter, ToolParameterType
+from ._fanout import fanout
+from ._render import provider_label
 from common.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+class ParamDiff(NamedTuple):
+    """Current vs default value of one parameter considered for reset."""
+
+    current: Any
+    default: Any
+    will_change: bool
+
+
+_SEP = "=" * 50
+_RESET_HEADER = ("🔄 Configuration Reset Request", _SEP, "")
+_RESET_ALL_WARNING = ("⚠️  This will reset ALL providers to default settings!", "")
+_SUCCESS_HEADER = ("✅ Configuration reset successfully!", "")
+_SUCCESS_FOOTER = ("", "All affected parameters have been reset to their default values.")
+_PARTIAL_HEADER = ("⚠️  Configuration reset completed with errors", "")
+
+_RESET_PROVIDER_ENUM = ("openai", "anthropic", "gemini", "openrouter", "all")
+_RESET_EXAMPLES = (
+    "reset_config()",
+    "reset_config(confirm=true)",
+    "reset_config(provider='openai', confirm=true)",
+    "reset_config(parameters=['temperature', 'max_tokens'], confirm=true)",
+    "reset_config(provider='all', confirm=true)",
+)
+
+# The definition is static, so it is built once at import and shared by all instances
+_RESET_TOOL_DEF = Tool(
+    name="reset_config",
+    description="Reset AI configuration parameters to their default values. Requires confirmation before making changes.",
+    parameters=[
+        ToolParameter(
+            name="provider",
+            type=ToolParameterType.STRING,
+            description="Provider to reset. Uses current provider if not specified.",
+            required=False,
+            enum=_RESET_PROVIDER_ENUM,
+        ),
+        ToolParameter(
+            name="confirm",
+            type=ToolParameterType.BOOLEAN,
+            description="Explicit confirmation to proceed with the reset",
+            required=False,
+            default=False,
+        ),
+        ToolParameter(
+            name="parameters",
+            type=ToolParameterType.ARRAY,
+            description="Specific parameters to reset. If not provided, all parameters will be reset.",
+            required=False,
+        ),
+    ],
+    examples=_RESET_EXAMPLES,
+    category="ai_configuration",
+    version="1.0.0",
+)
+
+
 class ResetConfigTool(ToolHandler):
     """
     Standard MCP tool for resetting AI configuration.
@@ -34,41 +93,7 @@ class ResetConfigTool(ToolHandler):
 
     def get_tool_definition(self) -> Tool:
         """Get the standard MCP tool definition."""
-        return Tool(
-            name="reset_config",
-            description="Reset AI configuration parameters to their default values. Requires confirmation before making changes.",
-            parameters=[
-                ToolParameter(
-                    name="provider",
-                    type=ToolParameterType.STRING,
-                    description="Provider to reset. Uses current provider if not specified.",
-                    required=False,
-                    enum=["openai", "anthropic", "gemini", "openrouter", "all"],
-                ),
-                ToolParameter(
-                    name="confirm",
-                    type=ToolParameterType.BOOLEAN,
-                    description="Explicit confirmation to proceed with the reset",
-                    required=False,
-                    default=False,
-                ),
-                ToolParameter(
-                    name="parameters",
-                    type=ToolParameterType.ARRAY,
-                    description="Specific parameters to reset. If not provided, all parameters will be reset.",
-                    required=False,
-                ),
-            ],
-            examples=[
-                "reset_config()",
-                "reset_config(confirm=true)",
-                "reset_config(provider='openai', confirm=true)",
-                "reset_config(parameters=['temperature', 'max_tokens'], confirm=true)",
-                "reset_config(provider='all', confirm=true)",
-            ],
-            category="ai_configuration",
-            version="1.0.0",
-        )
+        return _RESET_TOOL_DEF
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -80,6 +105,7 @@ class ResetConfigTool(ToolHandler):
         Returns:
             Reset result or confirmation request
         """
+        srv = self.mcp_server
         try:
             specified_provider = arguments.get("provider")
             confirmed = arguments.get("confirm", False)
@@ -92,54 +118,62 @@ class ResetConfigTool(ToolHandler):
                 specific_params=specific_params,
             )
 
+            # Resolve the argument-derived lookups once for the per-provider loops
+            specific_only = bool(specific_params)
+            specific_set = frozenset(specific_params)
+
             # Get current configuration
-            current_config = await self.mcp_server.get_active_provider_config()
+            current_config = await srv.get_active_provider_config()
             current_provider = current_config.get("provider")
 
             # Determine which provider(s) to reset
             if specified_provider == "all":
-                providers = await self.mcp_server.get_available_providers()
+                providers = await srv.get_available_providers()
                 reset_all = True
             else:
                 providers = [specified_provider or current_provider]
                 reset_all = False
 
+            # Fetch (current, default) values for all affected providers concurrently
+            values_by_provider = await fanout(srv, "get_parameter_values", providers)
+
             # Collect current vs default values for all affected providers
             reset_details = {}
-            for provider in providers:
+            # ParamDiff entries for the parameters that differ from their defaults, per provider
+            changed_by_provider: Dict[str, Dict[str, ParamDiff]] = {}
+            # Default values to apply per provider, gathered in the same pass
+            defaults_by_provider: Dict[str, Dict[str, Any]] = {}
+            any_changes = False
+            for provider, values in values_by_provider.items():
                 try:
-                    constraints = await self.mcp_server.get_parameter_constraints(provider)
+                    if "error" in values:
+                        raise RuntimeError(values["error"])
 
                     # Determine which parameters to reset
-                    if specific_params:
+                    if specific_only:
                         # Only reset specified parameters
-                        params_to_reset = {
-                            k: v for k, v in constraints.items() if k in specific_params
-                        }
+                        params_to_reset = {k: v for k, v in values.items() if k in specific_set}
                     else:
                         # Reset all parameters
-                        params_to_reset = constraints
+                        params_to_reset = values
 
                     # Collect current vs default for each parameter
                     changes = {}
-                    for param_name, info in params_to_reset.items():
-                        current_value = info["current_value"]
-                        default_value = info["default"]
-
-                        if current_value != default_value:
-                            changes[param_name] = {
-                                "current": current_value,
-                                "default": default_value,
-                                "will_change": True,
-                            }
-                        else:
-                            changes[param_name] = {
-                                "current": current_value,
-                                "default": default_value,
-                                "will_change": False,
-                            }
+                    changed = {}
+                    defaults = {}
+                    for param_name, (current_value, default_value) in params_to_reset.items():
+                        will_change = current_value != default_value
+
+                        diff = ParamDiff(current_value, default_value, will_change)
+                        changes[param_name] = diff
+                        if will_change:
+                            changed[param_name] = diff
+                            defaults[param_name] = default_value
 
                     reset_details[provider] = changes
+                    changed_by_provider[provider] = changed
+                    defaults_by_provider[provider] = defaults
+                    any_changes = any_changes or bool(changed)
 
                 except Exception as e:
                     logger.warning(
@@ -150,12 +184,6 @@ class ResetConfigTool(ToolHandler):
                     reset_details[provider] = {"error": str(e)}
 
             # Check if any changes will be made
-            any_changes = any(
-                any(param["will_change"] for param in changes.values())
-                for changes in reset_details.values()
-                if isinstance(changes, dict) and "error" not in changes
-            )
-
             if not any_changes:
                 return {
                     "status": "no_change",
@@ -165,98 +193,38 @@ class ResetConfigTool(ToolHandler):
 
             # If not confirmed, return confirmation request
             if not confirmed:
-                lines = [
-                    "🔄 Configuration Reset Request",
-                    "=" * 50,
-                    "",
-                ]
-
-                if reset_all:
-                    lines.append("⚠️  This will reset ALL providers to default settings!")
-                    lines.append("")
-
-                for provider, changes in reset_details.items():
-                    if "error" in changes:
-                        lines.append(f"❌ {provider}: {changes['error']}")
-                    else:
-                        lines.append(f"📦 {provider.upper()}:")
-
-                        has_changes = False
-                        for param_name, info in changes.items():
-                            if info["will_change"]:
-                                has_changes = True
-                                lines.append(
-                                    f"  • {param_name}: {info['current']} → {info['default']}"
-                                )
-
-                        if not has_changes:
-                            lines.append("  (no changes needed)")
-
-                    lines.append("")
-
-                lines.append(
-                    "To confirm, use: reset_config("
-                    + (f"provider='{specified_provider}', " if specified_provider else "")
-                    + "confirm=true)"
+                lines = _render_confirmation(
+                    reset_details, changed_by_provider, reset_all, specified_provider
                 )
 
                 return {
                     "status": "confirmation_required",
                     "message": "\n".join(lines),
-                    "reset_details": reset_details,
+                    "reset_details": _details_as_dicts(reset_details),
                     "tool": "reset_config",
                 }
 
-            # Execute the reset
+            # Execute the reset for each provider concurrently
+            to_reset = list(defaults_by_provider.items())
+            outcomes = await asyncio.gather(
+                *(
+                    self._reset_provider(provider, defaults, specific_only)
+                    for provider, defaults in to_reset
+                )
+            )
+
+            results = {}
             success_count = 0
             error_count = 0
-            results = {}
-
-            for provider, changes in reset_details.items():
-                if "error" not in changes:
-                    try:
-                        # Only reset parameters that need changing
-                        params_to_reset = {
-                            param: info["default"]
-                            for param, info in changes.items()
-                            if info["will_change"]
-                        }
-
-                        if params_to_reset:
-                            # Reset to defaults using MCP server method
-                            if specific_params:
-                                # Reset specific parameters
-                                for param_name, default_value in params_to_reset.items():
-                                    success = await self.mcp_server.set_provider_parameter(
-                                        provider, param_name, default_value
-                                    )
-                                    if success:
-                                        success_count += 1
-                            else:
-                                # Reset all parameters
-                                success = await self.mcp_server.reset_to_defaults(provider)
-                                if success:
-                                    success_count += 1
-
-                            results[provider] = "success"
-                        else:
-                            results[provider] = "no_changes"
-
-                    except Exception as e:
-                        error_count += 1
-                        results[provider] = f"error: {str(e)}"
-                        logger.error(
-                            event="reset_execution_error",
-                            provider=provider,
-                            error=str(e),
-                        )
+            for (provider, _), (outcome, reset_count) in zip(to_reset, outcomes, strict=True):
+                results[provider] = outcome
+                success_count += reset_count
+                if outcome.startswith("error"):
+                    error_count += 1
 
             # Build result message
             if error_count == 0:
-                result_lines = [
-                    "✅ Configuration reset successfully!",
-                    "",
-                ]
+                result_lines = [*_SUCCESS_HEADER]
 
                 for provider, result in results.items():
                     if result == "success":
@@ -264,17 +232,11 @@ class ResetConfigTool(ToolHandler):
                     elif result == "no_changes":
                         result_lines.append(f"- {provider}: Already at defaults")
 
-                result_lines.append("")
-                result_lines.append(
-                    "All affected parameters have been reset to their default values."
-                )
+                result_lines.extend(_SUCCESS_FOOTER)
 
                 status = "success"
             else:
-                result_lines = [
-                    "⚠️  Configuration reset completed with errors",
-                    "",
-                ]
+                result_lines = [*_PARTIAL_HEADER]
 
                 for provider, result in results.items():
                     if result == "success":
@@ -315,3 +277,88 @@ class ResetConfigTool(ToolHandler):
                 "message": f"Failed to reset configuration: {str(e)}",
                 "tool": "reset_config",
             }
+
+    async def _reset_provider(
+        self, provider: str, params_to_reset: Dict[str, Any], specific_only: bool
+    ) -> Tuple[str, int]:
+        """
+        Reset one provider's changed parameters to their defaults.
+
+        Args:
+            provider: Provider to reset
+            params_to_reset: Default value for each parameter that differs from it
+            specific_only: Reset only the listed parameters instead of the whole provider
+
+        Returns:
+            Tuple of the outcome ("success", "no_changes" or "error: ...") and
+            the number of successful resets to count
+        """
+        try:
+            if not params_to_reset:
+                return "no_changes", 0
+
+            # Reset to defaults using MCP server method
+            if specific_only:
+                # Reset specific parameters in a single write
+                updated = await self.mcp_server.set_provider_parameters(provider, params_to_reset)
+                return "success", sum(updated.values())
+
+            # Reset all parameters
+            success = await self.mcp_server.reset_to_defaults(provider)
+            return "success", 1 if success else 0
+
+        except Exception as e:
+            logger.error(
+                event="reset_execution_error",
+                provider=provider,
+                error=str(e),
+            )
+            return f"error: {str(e)}", 0
+
+
+def _render_confirmation(
+    reset_details: Dict[str, Dict[str, Union[ParamDiff, str]]],
+    changed_by_provider: Dict[str, Dict[str, ParamDiff]],
+    reset_all: bool,
+    specified_provider: Optional[str],
+) -> Iterator[str]:
+    """Yield the lines of the reset confirmation request."""
+    yield from _RESET_HEADER
+
+    if reset_all:
+        yield from _RESET_ALL_WARNING
+
+    for provider, changes in reset_details.items():
+        if "error" in changes:
+            yield f"❌ {provider}: {changes['error']}"
+        else:
+            yield provider_label(provider)
+
+            changed = changed_by_provider[provider]
+            for param_name, (current_value, default_value, _) in changed.items():
+                yield f"  • {param_name}: {current_value} → {default_value}"
+
+            if not changed:
+                yield "  (no changes needed)"
+
+        yield ""
+
+    yield (
+        "To confirm, use: reset_config("
+        + (f"provider='{specified_provider}', " if specified_provider else "")
+        + "confirm=true)"
+    )
+
+
+def _details_as_dicts(
+    reset_details: Dict[str, Dict[str, Union[ParamDiff, str]]],
+) -> Dict[str, Dict[str, Any]]:
+    """Convert ParamDiff entries to the dict shape returned to clients."""
+    return {
+        provider: (
+            changes
+            if "error" in changes
+            else {param_name: diff._asdict() for param_name, diff in changes.items()}
+        )
+        for provider, changes in reset_details.items()
+    }
@@ -11,6 +11,7 @@ Standard MCP Tool: show_current_config
 - Provides parameter constraints and valid ranges
 """
 
+from operator import attrgetter
 from typing import Dict, Any
 
 from ..tool_registry import ToolHandler, Tool, ToolParameter, ToolParameterType
@@ -18,6 +19,57 @@ from common.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Read several ParameterInfo fields in one C-level call
+_current_and_default = attrgetter("current_value", "default")
+_verbose_fields = attrgetter(
+    "current_value", "default", "min_value", "max_value", "enum_values", "description"
+)
+
+_SEP = "=" * 50
+_SHOW_HEADER = ("🤖 Current AI Configuration", _SEP)
+# Blank line and hint, pre-joined into the single string the joined output contains
+_SHOW_FOOTER = "\n💡 Use 'ai_configure' to modify these settings"
+
+# Per-parameter row templates, formatted once per parameter
+_COMPACT_ROW = "  %s: %s%s"
+_DETAILED_ROW = "\n• %s:\n  Current: %s %s"
+_VERBOSE_ROW = "  Default: %s\n  Type: %s"
+_RANGE_ROW = "  Range: %s - %s"
+
+_SHOW_FORMAT_ENUM = ("detailed", "compact", "json")
+_SHOW_EXAMPLES = (
+    "show_current_config()",
+    "show_current_config(verbose=true)",
+    "show_current_config(format='compact')",
+    "show_current_config(verbose=true, format='json')",
+)
+
+# The definition is static, so it is built once at import and shared by all instances
+_SHOW_TOOL_DEF = Tool(
+    name="show_current_config",
+    description="Display current AI configuration including provider, model, and all parameter settings. Shows which values differ from defaults and provides valid ranges.",
+    parameters=[
+        ToolParameter(
+            name="verbose",
+            type=ToolParameterType.BOOLEAN,
+            description="Include detailed parameter descriptions and constraints",
+            required=False,
+            default=False,
+        ),
+        ToolParameter(
+            name="format",
+            type=ToolParameterType.STRING,
+            description="Output format for the configuration",
+            required=False,
+            default="detailed",
+            enum=_SHOW_FORMAT_ENUM,
+        ),
+    ],
+    examples=_SHOW_EXAMPLES,
+    category="ai_configuration",
+    version="1.0.0",
+)
+
 
 class ShowConfigTool(ToolHandler):
     """
@@ -34,35 +86,7 @@ class ShowConfigTool(ToolHandler):
 
     def get_tool_definition(self) -> Tool:
         """Get the standard MCP tool definition."""
-        return Tool(
-            name="show_current_config",
-            description="Display current AI configuration including provider, model, and all parameter settings. Shows which values differ from defaults and provides valid ranges.",
-            parameters=[
-                ToolParameter(
-                    name="verbose",
-                    type=ToolParameterType.BOOLEAN,
-                    description="Include detailed parameter descriptions and constraints",
-                    required=False,
-                    default=False,
-                ),
-                ToolParameter(
-                    name="format",
-                    type=ToolParameterType.STRING,
-                    description="Output format for the configuration",
-                    required=False,
-                    default="detailed",
-                    enum=["detailed", "compact", "json"],
-                ),
-            ],
-            examples=[
-                "show_current_config()",
-                "show_current_config(verbose=true)",
-                "show_current_config(format='compact')",
-                "show_current_config(verbose=true, format='json')",
-            ],
-            category="ai_configuration",
-            version="1.0.0",
-        )
+        return _SHOW_TOOL_DEF
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -74,6 +98,7 @@ class ShowConfigTool(ToolHandler):
         Returns:
             Current configuration details
         """
+        srv = self.mcp_server
         try:
             verbose = arguments.get("verbose", False)
             output_format = arguments.get("format", "detailed")
@@ -85,12 +110,18 @@ class ShowConfigTool(ToolHandler):
             )
 
             # Get current configuration from MCP server
-            config = await self.mcp_server.get_active_provider_config()
+            config = await srv.get_active_provider_config()
             provider = config.get("provider", "unknown")
             model = config.get("model", "unknown")
 
-            # Get parameter constraints for the current provider
-            constraints = await self.mcp_server.get_parameter_constraints(provider)
+            # Full constraints are only shown in verbose mode; otherwise the
+            # current and default values are all that is rendered
+            if verbose:
+                constraints = await srv.get_parameter_constraints(provider)
+                values = {name: _current_and_default(info) for name, info in constraints.items()}
+            else:
+                constraints = {}
+                values = await srv.get_parameter_values(provider)
 
             # Build configuration display
             if output_format == "json":
@@ -99,14 +130,14 @@ class ShowConfigTool(ToolHandler):
                     "provider": provider,
                     "model": model,
                     "parameters": {},
-                    "constraints": constraints if verbose else {},
+                    "constraints": {name: info.to_dict() for name, info in constraints.items()},
                 }
 
-                for param_name, constraint in constraints.items():
+                for param_name, (value, default) in values.items():
                     display_data["parameters"][param_name] = {
-                        "value": constraint["current_value"],
-                        "default": constraint["default"],
-                        "is_default": constraint["current_value"] == constraint["default"],
+                        "value": value,
+                        "default": default,
+                        "is_default": value == default,
                     }
 
                 formatted_output = display_data
@@ -120,56 +151,52 @@ class ShowConfigTool(ToolHandler):
                     "Parameters:",
                 ]
 
-                for param_name, constraint in constraints.items():
-                    value = constraint["current_value"]
-                    is_default = value == constraint["default"]
-                    status = "" if is_default else " *"
-                    lines.append(f"  {param_name}: {value}{status}")
+                lines.extend(
+                    _COMPACT_ROW % (param_name, value, "" if value == default else " *")
+                    for param_name, (value, default) in values.items()
+                )
 
                 formatted_output = "\n".join(lines)
 
             else:  # detailed format
                 # Detailed text format
                 lines = [
-                    "🤖 Current AI Configuration",
-                    "=" * 50,
+                    *_SHOW_HEADER,
                     f"Provider: {provider}",
                     f"Model: {model}",
                     "",
                     "📊 Parameters:",
                 ]
 
-                for param_name, constraint in constraints.items():
-                    value = constraint["current_value"]
-                    default = constraint["default"]
-                    is_default = value == default
-
-                    lines.append(f"\n• {param_name}:")
-                    lines.append(
-                        f"  Current: {value} {'(default)' if is_default else '(modified)'}"
+                if verbose:
+                    # Single pass over the constraints, reading each field once
+                    for param_name, constraint in constraints.items():
+                        value, default, min_value, max_value, enum_values, description = (
+                            _verbose_fields(constraint)
+                        )
+
+                        lines.append(
+                            _DETAILED_ROW
+                            % (param_name, value, "(default)" if value == default else "(modified)")
+                        )
+                        lines.append(_VERBOSE_ROW % (default, constraint.type))
+
+                        if min_value is not None or max_value is not None:
+                            lines.append(_RANGE_ROW % (min_value, max_value))
+
+                        if enum_values:
+                            lines.append(f"  Options: {', '.join(enum_values)}")
+
+                        if description:
+                            lines.append(f"  Description: {description}")
+                else:
+                    lines.extend(
+                        _DETAILED_ROW
+                        % (param_name, value, "(default)" if value == default else "(modified)")
+                        for param_name, (value, default) in values.items()
                     )
 
-                    if verbose:
-                        lines.append(f"  Default: {default}")
-                        lines.append(f"  Type: {constraint['type']}")
-
-                        if (
-                            constraint["min_value"] is not None
-                            or constraint["max_value"] is not None
-                        ):
-                            range_str = (
-                                f"  Range: {constraint['min_value']} - {constraint['max_value']}"
-                            )
-                            lines.append(range_str)
-
-                        if constraint["enum_values"]:
-                            lines.append(f"  Options: {', '.join(constraint['enum_values'])}")
-
-                        if constraint["description"]:
-                            lines.append(f"  Description: {constraint['description']}")
-
-                lines.append("")
-                lines.append("💡 Use 'ai_configure' to modify these settings")
+                lines.append(_SHOW_FOOTER)
 
                 formatted_output = "\n".join(lines)
 
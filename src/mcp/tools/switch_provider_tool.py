@@ -18,6 +18,77 @@ from common.logging import get_logger
 
 logger = get_logger(__name__)
 
+_SEP = "=" * 50
+
+# Message templates, filled with cur_/tgt_ provider and model values
+_CONFIRM_TEMPLATE = "\n".join(
+    (
+        "🔄 Provider Switch Request",
+        _SEP,
+        "",
+        "Current Configuration:",
+        "  Provider: {cur_provider}",
+        "  Model: {cur_model}",
+        "",
+        "Target Configuration:",
+        "  Provider: {tgt_provider}",
+        "  Model: {tgt_model}",
+        "",
+        "⚠️  This will change the AI provider for all future interactions.",
+        "",
+        "To confirm, use: switch_provider(provider='{tgt_provider}', confirm=true)",
+    )
+)
+_SUCCESS_TEMPLATE = "\n".join(
+    (
+        "✅ Provider switched successfully!",
+        "",
+        "Previous: {cur_provider} ({cur_model})",
+        "Current: {tgt_provider} ({tgt_model})",
+        "",
+        "The new provider is now active for all interactions.",
+    )
+)
+
+_SWITCH_PROVIDER_ENUM = ("openai", "anthropic", "gemini", "openrouter")
+_VALID_PROVIDERS = frozenset(_SWITCH_PROVIDER_ENUM)
+_SWITCH_EXAMPLES = (
+    "switch_provider(provider='anthropic')",
+    "switch_provider(provider='openai', confirm=true)",
+    "switch_provider(provider='gemini', model='gemini-1.5-pro', confirm=true)",
+)
+
+# The definition is static, so it is built once at import and shared by all instances
+_SWITCH_TOOL_DEF = Tool(
+    name="switch_provider",
+    description="Switch the active AI provider. Requires confirmation before making the change. Shows comparison between current and target provider.",
+    parameters=[
+        ToolParameter(
+            name="provider",
+            type=ToolParameterType.STRING,
+            description="Target provider to switch to",
+            required=True,
+            enum=_SWITCH_PROVIDER_ENUM,
+        ),
+        ToolParameter(
+            name="confirm",
+            type=ToolParameterType.BOOLEAN,
+            description="Explicit confirmation to proceed with the switch",
+            required=False,
+            default=False,
+        ),
+        ToolParameter(
+            name="model",
+            type=ToolParameterType.STRING,
+            description="Optional: specific model to use with the new provider",
+            required=False,
+        ),
+    ],
+    examples=_SWITCH_EXAMPLES,
+    category="ai_configuration",
+    version="1.0.0",
+)
+
 
 class SwitchProviderTool(ToolHandler):
     """
@@ -34,39 +105,7 @@ class SwitchProviderTool(ToolHandler):
 
     def get_tool_definition(self) -> Tool:
         """Get the standard MCP tool definition."""
-        return Tool(
-            name="switch_provider",
-            description="Switch the active AI provider. Requires confirmation before making the change. Shows comparison between current and target provider.",
-            parameters=[
-                ToolParameter(
-                    name="provider",
-                    type=ToolParameterType.STRING,
-                    description="Target provider to switch to",
-                    required=True,
-                    enum=["openai", "anthropic", "gemini", "openrouter"],
-                ),
-                ToolParameter(
-                    name="confirm",
-                    type=ToolParameterType.BOOLEAN,
-                    description="Explicit confirmation to proceed with the switch",
-                    required=False,
-                    default=False,
-                ),
-                ToolParameter(
-                    name="model",
-                    type=ToolParameterType.STRING,
-                    description="Optional: specific model to use with the new provider",
-                    required=False,
-                ),
-            ],
-            examples=[
-                "switch_provider(provider='anthropic')",
-                "switch_provider(provider='openai', confirm=true)",
-                "switch_provider(provider='gemini', model='gemini-1.5-pro', confirm=true)",
-            ],
-            category="ai_configuration",
-            version="1.0.0",
-        )
+        return _SWITCH_TOOL_DEF
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -78,6 +117,7 @@ class SwitchProviderTool(ToolHandler):
         Returns:
             Switch result or confirmation request
         """
+        srv = self.mcp_server
         try:
             target_provider = arguments["provider"]
             confirmed = arguments.get("confirm", False)
@@ -91,12 +131,14 @@ class SwitchProviderTool(ToolHandler):
             )
 
             # Get current configuration
-            current_config = await self.mcp_server.get_active_provider_config()
+            current_config = await srv.get_active_provider_config()
             current_provider = current_config.get("provider")
             current_model = current_config.get("model")
 
-            # Check if already on target provider
-            if current_provider == target_provider and not target_model:
+            # Check if already on target provider (and model, if one was given)
+            if current_provider == target_provider and (
+                not target_model or target_model == current_model
+            ):
                 return {
                     "status": "no_change",
                     "message": f"Already using {target_provider}",
@@ -105,34 +147,36 @@ class SwitchProviderTool(ToolHandler):
                     "tool": "switch_provider",
                 }
 
-            # Validate target provider
-            available_providers = await self.mcp_server.get_available_providers()
-            if target_provider not in available_providers:
-                return {
-                    "status": "error",
-                    "error": f"Provider '{target_provider}' not available",
-                    "message": f"Available providers: {', '.join(available_providers)}",
-                    "tool": "switch_provider",
-                }
+            # Validate target provider; the server is only asked when the
+            # provider is outside the advertised enum
+            if target_provider not in _VALID_PROVIDERS:
+                available_providers = await srv.get_available_providers()
+                if target_provider not in available_providers:
+                    return {
+                        "status": "error",
+                        "error": f"Provider '{target_provider}' not available",
+                        "message": f"Available providers: {', '.join(available_providers)}",
+                        "tool": "switch_provider",
+                    }
 
             # Get available models for target provider
-            models_info = await self.mcp_server.get_available_models(target_provider)
-            available_models = [m["name"] for m in models_info["models"]]
+            models_info = await srv.get_available_models(target_provider)
 
             # Determine target model
             if target_model:
                 # Validate specified model
-                if target_model not in available_models:
+                if not await srv.is_available_model(target_provider, target_model):
+                    available_models = ", ".join(m["name"] for m in models_info["models"])
                     return {
                         "status": "error",
                         "error": f"Model '{target_model}' not available for {target_provider}",
-                        "message": f"Available models: {', '.join(available_models)}",
+                        "message": f"Available models: {available_models}",
                         "tool": "switch_provider",
                     }
                 final_model = target_model
             else:
                 # Use first available model as default
-                final_model = available_models[0] if available_models else None
+                final_model = models_info.get("default_model")
                 if not final_model:
                     return {
                         "status": "error",
@@ -140,30 +184,20 @@ class SwitchProviderTool(ToolHandler):
                         "tool": "switch_provider",
                     }
 
+            template_values = {
+                "cur_provider": current_provider,
+                "cur_model": current_model,
+                "tgt_provider": target_provider,
+                "tgt_model": final_model,
+            }
+
             # If not confirmed, return confirmation request
             if not confirmed:
-                comparison_lines = [
-                    "🔄 Provider Switch Request",
-                    "=" * 50,
-                    "",
-                    "Current Configuration:",
-                    f"  Provider: {current_provider}",
-                    f"  Model: {current_model}",
-                    "",
-                    "Target Configuration:",
-                    f"  Provider: {target_provider}",
-                    f"  Model: {final_model}",
-                    "",
-                    "⚠️  This will change the AI provider for all future interactions.",
-                    "",
-                    "To confirm, use: switch_provider(provider='"
-                    + target_provider
-                    + "', confirm=true)",
-                ]
+                message = _CONFIRM_TEMPLATE.format_map(template_values)
 
                 return {
                     "status": "confirmation_required",
-                    "message": "\n".join(comparison_lines),
+                    "message": message,
                     "current_provider": current_provider,
                     "current_model": current_model,
                     "target_provider": target_provider,
@@ -172,27 +206,18 @@ class SwitchProviderTool(ToolHandler):
                 }
 
             # Execute the switch
-            success = await self.mcp_server.switch_active_provider(target_provider)
+            success = await srv.switch_active_provider(target_provider)
 
             if success:
                 # Update model if different from current default
                 if target_model:
-                    await self.mcp_server.set_provider_parameter(
-                        target_provider, "model", final_model
-                    )
-
-                result_lines = [
-                    "✅ Provider switched successfully!",
-                    "",
-                    f"Previous: {current_provider} ({current_model})",
-                    f"Current: {target_provider} ({final_model})",
-                    "",
-                    "The new provider is now active for all interactions.",
-                ]
+                    await srv.set_provider_parameter(target_provider, "model", final_model)
+
+                message = _SUCCESS_TEMPLATE.format_map(template_values)
 
                 result = {
                     "status": "success",
-                    "message": "\n".join(result_lines),
+                    "message": message,
                     "previous_provider": current_provider,
                     "previous_model": current_model,
                     "current_provider": target_provider,
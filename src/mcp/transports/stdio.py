@@ -8,12 +8,14 @@ Reference: https://modelcontextprotocol.io/specification/2025-06-18/basic/transp
 """
 
 import asyncio
-import json
+import os
 import sys
 from typing import Any, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import BaseModel
 
 from common.logging import get_logger
+from common.serialization import JSONDecodeError, dumps, loads
 from ..jsonrpc import (
     JSONRPCHandler,
     JSONRPCRequest,
@@ -25,6 +27,20 @@ from ..mcp2025_server import MCP2025Server
 
 logger = get_logger(__name__)
 
+# Largest single JSON-RPC line accepted from stdin; StreamReader's 64 KiB default is too
+# small for tool payloads
+STDIN_LINE_LIMIT = 16 * 1024 * 1024
+
+# Undrained stdout bytes allowed to build up between notification writes before waiting
+# on the pipe; responses always drain
+STDOUT_DRAIN_THRESHOLD = 16 * 1024
+
+# Pre-serialized frames for id-less error responses, matching JSONRPCErrorResponse's
+# model_dump_json output; only the message is encoded per error
+_PARSE_ERROR_HEAD = b'{"jsonrpc":"2.0","id":null,"error":{"code":%d,"message":' % PARSE_ERROR
+_INTERNAL_ERROR_HEAD = b'{"jsonrpc":"2.0","id":null,"error":{"code":%d,"message":' % INTERNAL_ERROR
+_ERROR_FRAME_TAIL = b',"data":null}}\n'
+
 
 class StdioTransport:
     """
@@ -37,9 +53,15 @@ class StdioTransport:
     def __init__(self, mcp_server: MCP2025Server):
         """Initialize stdio transport."""
         self.mcp_server = mcp_server
-        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stdio")
         self.running = False
         self.reader_task: Optional[asyncio.Task] = None
+        # Native pipe streams; None when stdin/stdout is not a pipe (e.g. a regular file)
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        # Bytes written to self._writer since its last drain()
+        self._pending_bytes = 0
+        # Event loop the transport runs on, captured in start()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def start(self) -> None:
         """Start the stdio transport."""
@@ -47,7 +69,14 @@ class StdioTransport:
             return
 
         self.running = True
-        logger.info(event="stdio_transport_started", message="MCP stdio transport started")
+        self._loop = asyncio.get_running_loop()
+        await self._open_streams()
+        logger.info(
+            event="stdio_transport_started",
+            message="MCP stdio transport started",
+            native_stdin=self._reader is not None,
+            native_stdout=self._writer is not None,
+        )
 
         # Start reading from stdin
         self.reader_task = asyncio.create_task(self._read_stdin())
@@ -69,24 +98,109 @@ class StdioTransport:
             except asyncio.CancelledError:
                 pass
 
-        self.executor.shutdown(wait=True)
+        # Let coalesced notification frames reach the client before shutting down
+        if self._writer is not None and self._pending_bytes:
+            self._pending_bytes = 0
+            try:
+                await self._writer.drain()
+            except (ConnectionError, RuntimeError):
+                pass
+
         logger.info(event="stdio_transport_stopped")
 
+    async def _open_streams(self) -> None:
+        """
+        Attach asyncio streams to stdin and stdout.
+
+        Pipes are read and written without a thread hop per message. The
+        event loop switches a stream's file to non-blocking mode, so a stream
+        that is the same file as stderr (a terminal, or 2>&1) keeps using the
+        loop's default executor, as does anything the loop cannot watch (e.g.
+        stdin redirected from a regular file).
+        """
+        loop = self._loop
+
+        if not _same_file_as_stderr(sys.stdin):
+            reader = asyncio.StreamReader(limit=STDIN_LINE_LIMIT)
+            try:
+                await loop.connect_read_pipe(
+                    lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+                )
+                self._reader = reader
+            except (ValueError, OSError) as e:
+                logger.debug(event="stdio_stdin_pipe_unavailable", error=str(e))
+
+        if not _same_file_as_stderr(sys.stdout):
+            try:
+                transport, protocol = await loop.connect_write_pipe(
+                    asyncio.streams.FlowControlMixin, sys.stdout
+                )
+                self._writer = asyncio.StreamWriter(transport, protocol, None, loop)
+            except (ValueError, OSError) as e:
+                logger.debug(event="stdio_stdout_pipe_unavailable", error=str(e))
+
+    async def _readline(self) -> bytes:
+        """
+        Read one raw line from stdin.
+
+        Returns:
+            The line, or b"" at EOF
+
+        Raises:
+            ValueError: If the line exceeded STDIN_LINE_LIMIT; it has been discarded
+        """
+        if self._reader is None:
+            return await self._loop.run_in_executor(None, sys.stdin.buffer.readline)
+
+        try:
+            return await self._reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            # Final line without a newline, or b"" at EOF
+            return e.partial
+        except asyncio.LimitOverrunError as e:
+            await self._skip_line(e.consumed)
+            raise ValueError(f"Message exceeds {STDIN_LINE_LIMIT} bytes") from e
+
+    async def _skip_line(self, consumed: int) -> None:
+        """
+        Discard the rest of an oversized line from stdin.
+
+        Args:
+            consumed: Buffered bytes known not to end the line, from LimitOverrunError
+        """
+        reader = self._reader
+        try:
+            while True:
+                await reader.readexactly(consumed)
+                try:
+                    await reader.readuntil(b"\n")
+                    return
+                except asyncio.LimitOverrunError as e:
+                    consumed = e.consumed
+        except asyncio.IncompleteReadError:
+            # EOF inside the line; the next read reports it
+            return
+
     async def _read_stdin(self) -> None:
         """Read JSON-RPC messages from stdin."""
-        loop = asyncio.get_event_loop()
-
         try:
             while self.running:
                 # Read a line from stdin asynchronously
-                line = await loop.run_in_executor(self.executor, sys.stdin.readline)
+                try:
+                    line = await self._readline()
+                except ValueError as e:
+                    # The oversized frame was dropped; keep serving the next one
+                    logger.warning(event="stdin_message_too_large", error=str(e))
+                    await self._write_error(_PARSE_ERROR_HEAD, f"Parse error: {e}")
+                    continue
 
                 if not line:  # EOF
                     await self._log_to_stderr("Received EOF, shutting down")
                     break
 
-                line = line.strip()
-                if not line:
+                # The parser accepts the raw line, trailing newline included,
+                # so only blank lines need checking - no strip copy
+                if line.isspace():
                     continue
 
                 await self._handle_message(line)
@@ -95,11 +209,11 @@ class StdioTransport:
             logger.error(event="stdin_read_error", error=str(e))
             await self._log_to_stderr(f"Error reading stdin: {e}")
 
-    async def _handle_message(self, message: str) -> None:
+    async def _handle_message(self, message: bytes) -> None:
         """Handle a JSON-RPC message from stdin."""
         try:
             # Parse JSON
-            data = json.loads(message)
+            data = loads(message)
 
             # Parse as JSON-RPC message
             rpc_message = JSONRPCHandler.parse_message(data)
@@ -108,7 +222,7 @@ class StdioTransport:
                 # Handle request and send response to stdout
                 response = await self.mcp_server._handle_request(rpc_message)
                 if response:
-                    await self._write_stdout(response.model_dump())
+                    await self._write_model(response)
 
             elif isinstance(rpc_message, JSONRPCNotification):
                 # Handle notification (no response)
@@ -118,41 +232,71 @@ class StdioTransport:
                 # Unexpected message type
                 await self._log_to_stderr(f"Unexpected message type: {type(rpc_message)}")
 
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             # Send parse error
-            error_response = JSONRPCHandler.create_error_response(
-                None, PARSE_ERROR, f"Parse error: {str(e)}"
-            )
-            await self._write_stdout(error_response.model_dump())
+            await self._write_error(_PARSE_ERROR_HEAD, f"Parse error: {str(e)}")
 
         except Exception as e:
             logger.error(event="message_handle_error", error=str(e))
             # Send internal error
-            error_response = JSONRPCHandler.create_error_response(
-                None, INTERNAL_ERROR, f"Internal error: {str(e)}"
-            )
-            await self._write_stdout(error_response.model_dump())
+            await self._write_error(_INTERNAL_ERROR_HEAD, f"Internal error: {str(e)}")
+
+    async def _write_error(self, head: bytes, message: str) -> None:
+        """Write an id-less error response from a pre-serialized frame head."""
+        await self._write_frame(head + dumps(message) + _ERROR_FRAME_TAIL)
 
-    async def _write_stdout(self, data: Dict[str, Any]) -> None:
-        """Write JSON-RPC response to stdout."""
+    async def _write_model(self, model: BaseModel, drain: bool = True) -> None:
+        """
+        Write a JSON-RPC message model to stdout, serialized by pydantic-core in one pass.
+
+        Args:
+            model: JSON-RPC message to write
+            drain: Wait for the pipe to accept the frame; notifications pass False
+                so consecutive frames share a drain
+        """
         try:
-            message = json.dumps(data, separators=(",", ":"))
+            frame = model.model_dump_json().encode()
+        except Exception as e:
+            logger.error(event="stdout_write_error", error=str(e))
+            await self._log_to_stderr(f"Error writing to stdout: {e}")
+            return
+        await self._write_frame(frame + b"\n", drain)
+
+    async def _write_frame(self, message: bytes, drain: bool = True) -> None:
+        """
+        Write one newline-terminated frame to stdout.
 
-            # Write to stdout in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(self.executor, lambda: print(message, flush=True))
+        Args:
+            message: Encoded frame
+            drain: Drain the writer now rather than once STDOUT_DRAIN_THRESHOLD
+                bytes are pending
+        """
+        try:
+            if self._writer is not None:
+                self._writer.write(message)
+                self._pending_bytes += len(message)
+                if drain or self._pending_bytes >= STDOUT_DRAIN_THRESHOLD:
+                    self._pending_bytes = 0
+                    await self._writer.drain()
+            else:
+                # Write to stdout in the default executor to avoid blocking
+                await self._loop.run_in_executor(None, self._write_stdout_bytes, message)
 
         except Exception as e:
             logger.error(event="stdout_write_error", error=str(e))
             await self._log_to_stderr(f"Error writing to stdout: {e}")
 
+    @staticmethod
+    def _write_stdout_bytes(message: bytes) -> None:
+        """Write an encoded frame to stdout and flush it."""
+        sys.stdout.buffer.write(message)
+        sys.stdout.buffer.flush()
+
     async def _log_to_stderr(self, message: str) -> None:
         """Log a message to stderr for debugging."""
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                self.executor, lambda: print(f"[MCP] {message}", file=sys.stderr, flush=True)
-            )
+            # Diagnostics only and off the message path, so a direct write is fine
+            print(f"[MCP] {message}", file=sys.stderr, flush=True)
         except Exception:
             # Ignore stderr logging errors
             pass
@@ -160,7 +304,17 @@ class StdioTransport:
     async def send_notification(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
         """Send a notification to the client."""
         notification = JSONRPCHandler.create_notification(method, params)
-        await self._write_stdout(notification.model_dump())
+        await self._write_model(notification, drain=False)
+
+
+def _same_file_as_stderr(stream: Any) -> bool:
+    """Return True if a standard stream and stderr refer to the same file."""
+    try:
+        stat = os.fstat(stream.fileno())
+        stderr_stat = os.fstat(sys.stderr.fileno())
+    except (AttributeError, OSError, ValueError):
+        return False
+    return (stat.st_dev, stat.st_ino) == (stderr_stat.st_dev, stderr_stat.st_ino)
 
 
 class StdioServer:
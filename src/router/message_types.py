@@ -5,15 +5,19 @@ Added 2025-07-05: Router component message types.
 Following PROJECT_RULES.md: Single responsibility, type-safe models.
 """
 
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
 
+class RequestType(Enum):
+    """
+    Types of requests the router can handle.
 
-class RequestType(str, Enum):
-    """Types of requests the router can handle."""
+    A plain Enum so members compare by identity; use .value where the wire
+    string is needed.
+    """
 
     CHAT = "chat"  # Text generation with LLM function calling for device control
     IMAGE_GENERATION = "generate_image"  # Image generation requests
@@ -22,21 +26,41 @@ class RequestType(str, Enum):
     MCP_REQUEST = "mcp_request"  # Model Context Protocol requests for self-configuration
 
 
-class RouterRequest(BaseModel):
-    """Internal request format for router processing."""
+@dataclass(slots=True, frozen=True)
+class RouterRequest:
+    """
+    Internal request format for router processing.
+
+    Built by the gateway from an already validated client message, so it is a
+    plain slotted dataclass rather than a validating model.
+    """
 
     request_id: str
     request_type: RequestType
     payload: Dict[str, Any]
-    user_id: Optional[str] = None
     connection_id: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    user_id: Optional[str] = None
+    # Monotonic creation time in ns, for measuring queueing/processing latency
+    created_ns: int = field(default_factory=time.monotonic_ns)
 
 
-class RouterResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RouterResponse:
     """Internal response format from router."""
 
     request_id: str
     success: bool
     error: Optional[str] = None
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True, frozen=True)
+class ToolResult:
+    """Outcome of one model tool call executed by the router."""
+
+    tool_call_id: str
+    # Text returned to the model as the tool message content
+    result: str
+    success: bool
+    # Full MCP content blocks, kept for debugging
+    mcp_content: Optional[List[Dict[str, Any]]] = None
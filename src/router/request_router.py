@@ -14,36 +14,84 @@ Following PROJECT_RULES.md:
 """
 
 import asyncio
+import importlib
+import logging
 import os
-from typing import AsyncGenerator, Dict, Any, Optional, TYPE_CHECKING
-
-from adapters.base import AdapterRequest, BaseAdapter
-from adapters.openai_adapter import OpenAIAdapter
+from typing import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Any,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+import httpx
+
+from adapters.base import AdapterRequest, AdapterResponse, BaseAdapter
+from adapters.key_balanced_adapter import KeyBalancedAdapter
 from common.config import Config
 from common.logging import TimedLogger, get_logger
 from common.models import Chunk, ChunkType, WebSocketResponse
-from router.message_types import RequestType, RouterRequest
+from common.serialization import JSONDecodeError, loads
+from router.message_types import RequestType, RouterRequest, ToolResult
+from router.response_cache import CachedChunk, ResponseCache
 
 if TYPE_CHECKING:
     from mcp.mcp2025_server import MCP2025Server
 
-# Import other adapters with fallback handling
-try:
-    from adapters.anthropic_adapter import AnthropicAdapter
-except ImportError:
-    AnthropicAdapter = None
-
-try:
-    from adapters.gemini_adapter import GeminiAdapter
-except ImportError:
-    GeminiAdapter = None
-
-try:
-    from adapters.openrouter_adapter import OpenRouterAdapter
-except ImportError:
-    OpenRouterAdapter = None
-
 logger = get_logger(__name__)
+# Underlying stdlib logger, checked once per request before per-chunk debug logging
+_stdlib_logger = logging.getLogger(__name__)
+
+# Supported providers: (name, API key env var, adapter module, adapter class)
+_PROVIDERS = (
+    ("openai", "OPENAI_API_KEY", "adapters.openai_adapter", "OpenAIAdapter"),
+    ("anthropic", "ANTHROPIC_API_KEY", "adapters.anthropic_adapter", "AnthropicAdapter"),
+    ("gemini", "GEMINI_API_KEY", "adapters.gemini_adapter", "GeminiAdapter"),
+    ("openrouter", "OPENROUTER_API_KEY", "adapters.openrouter_adapter", "OpenRouterAdapter"),
+)
+
+# Providers whose SDK holds a single process-wide API key; extra keys are ignored
+_SINGLE_KEY_PROVIDERS = frozenset({"gemini"})
+
+# Upper bound in seconds for a single provider health check
+HEALTH_CHECK_TIMEOUT = 5.0
+
+# Upper bound in seconds for closing all adapters on shutdown
+SHUTDOWN_TIMEOUT = 5.0
+
+# Tool offered to the model on chat requests (primary MCP tool); built once, read-only
+_AI_CONFIGURE_TOOL: Dict[str, Any] = {
+    "name": "ai_configure",
+    "description": "Configure AI model parameters using natural language commands. Supports creative/conservative adjustments, explicit parameter setting, and provider-aware constraints.",
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "request": {
+                "type": "string",
+                "description": "Natural language description of desired parameter changes. Examples: 'make responses more creative', 'set temperature to 0.8', 'reduce randomness and be more focused'",
+            },
+            "context": {
+                "type": "object",
+                "description": "Additional context for the configuration request",
+            },
+            "confidence_threshold": {
+                "type": "number",
+                "description": "Minimum confidence required to apply changes automatically (0.0-1.0)",
+            },
+        },
+        "required": ["request"],
+    },
+}
+
+# Streamed text is buffered into one chunk until it reaches this many characters
+# or the oldest buffered piece is this many seconds old
+STREAM_COALESCE_CHARS = 64
+STREAM_COALESCE_SECONDS = 0.02
 
 
 class RequestRouter:
@@ -60,9 +108,34 @@ class RequestRouter:
     def __init__(self, config: Config, mcp_server: Optional["MCP2025Server"] = None):
         self.config = config
         self.mcp_server = mcp_server
+        # Adapters created so far, keyed by provider; filled on first use
         self.adapters: Dict[str, BaseAdapter] = {}
+        # Zero-arg constructors for every provider with an API key configured
+        self._adapter_factories: Dict[str, Callable[[], BaseAdapter]] = {}
+        # Connection pool shared by every adapter's SDK client
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=config.router.request_timeout,
+        )
+        # (provider, adapter) last returned by _get_active_adapter
+        self._active_adapter: Optional[Tuple[str, BaseAdapter]] = None
+        # Completed chat responses for requests that opt in with allow_cache
+        self._response_cache = ResponseCache(
+            config.router.response_cache_size, config.router.response_cache_ttl
+        )
 
-        # Initialize all available adapters with MCP server
+        # Handler per request type, looked up once per request in process_request
+        self._dispatch: Dict[
+            RequestType, Callable[[RouterRequest], AsyncGenerator[WebSocketResponse, None]]
+        ] = {
+            RequestType.CHAT: self._handle_chat_request,
+            RequestType.IMAGE_GENERATION: self._handle_image_request,
+            RequestType.AUDIO_STREAM: self._handle_audio_request,
+            RequestType.FRONTEND_COMMAND: self._handle_frontend_command,
+            RequestType.MCP_REQUEST: self._handle_mcp_request,
+        }
+
+        # Register all available adapters with MCP server
         self._initialize_adapters()
 
         logger.info(
@@ -70,13 +143,23 @@ class RequestRouter:
             message="Router initialized with MCP server for dynamic configuration",
             timeout=config.router.request_timeout,
             max_retries=config.router.max_retries,
-            available_providers=list(self.adapters.keys()),
+            available_providers=self.available_providers,
             active_provider=config.providers.active,
             has_mcp_server=bool(mcp_server),
         )
 
+    @property
+    def available_providers(self) -> List[str]:
+        """Providers that have an adapter registered, whether or not it is created yet."""
+        return list(self._adapter_factories)
+
     def _initialize_adapters(self) -> None:
-        """Initialize all available adapters with MCP server."""
+        """
+        Register adapter factories for all providers with an API key.
+
+        Adapters (and their SDK modules) are only created when a provider is
+        first used; see _get_adapter.
+        """
         if not self.mcp_server:
             logger.error(
                 event="adapter_initialization_error",
@@ -85,50 +168,34 @@ class RequestRouter:
             raise RuntimeError("MCP server required for adapter initialization")
 
         try:
-            # Initialize OpenAI adapter
-            if os.getenv("OPENAI_API_KEY"):
-                self.adapters["openai"] = OpenAIAdapter(self.mcp_server)
-                logger.info(
-                    event="openai_adapter_loaded",
-                    message="OpenAI adapter initialized with MCP server",
-                )
-
-            # Initialize Anthropic adapter
-            if os.getenv("ANTHROPIC_API_KEY") and AnthropicAdapter is not None:
-                self.adapters["anthropic"] = AnthropicAdapter(self.mcp_server)
-                logger.info(
-                    event="anthropic_adapter_loaded",
-                    message="Anthropic adapter initialized with MCP server",
-                )
-
-            # Initialize Gemini adapter
-            if os.getenv("GEMINI_API_KEY") and GeminiAdapter is not None:
-                self.adapters["gemini"] = GeminiAdapter(self.mcp_server)
-                logger.info(
-                    event="gemini_adapter_loaded",
-                    message="Gemini adapter initialized with MCP server",
-                )
-
-            # Initialize OpenRouter adapter
-            if os.getenv("OPENROUTER_API_KEY") and OpenRouterAdapter is not None:
-                self.adapters["openrouter"] = OpenRouterAdapter(self.mcp_server)
-                logger.info(
-                    event="openrouter_adapter_loaded",
-                    message="OpenRouter adapter initialized with MCP server",
-                )
+            for provider, env_var, module_name, class_name in _PROVIDERS:
+                api_keys = _api_keys(env_var)
+                if provider in _SINGLE_KEY_PROVIDERS:
+                    api_keys = api_keys[:1]
+                if api_keys:
+                    self._adapter_factories[provider] = self._adapter_factory(
+                        module_name, class_name, api_keys
+                    )
+                    logger.info(
+                        event="adapter_registered",
+                        message=f"{class_name} registered with MCP server",
+                        provider=provider,
+                        api_keys=len(api_keys),
+                    )
 
             # Ensure we have at least one adapter available
-            if not self.adapters:
+            if not self._adapter_factories:
                 raise ValueError(
                     "No AI providers available. Please set at least one API key: "
-                    "OPENAI_API_KEY, ANTHROPIC_API_KEY, GEMINI_API_KEY, or OPENROUTER_API_KEY"
+                    "OPENAI_API_KEY, ANTHROPIC_API_KEY, GEMINI_API_KEY, or OPENROUTER_API_KEY "
+                    "(or a comma-separated list in the matching *_API_KEYS variable)"
                 )
 
             logger.info(
                 event="adapters_initialized",
-                message="Adapters initialized successfully",
-                adapters=list(self.adapters.keys()),
-                total_adapters=len(self.adapters),
+                message="Adapters registered successfully",
+                adapters=self.available_providers,
+                total_adapters=len(self._adapter_factories),
             )
         except Exception as e:
             logger.error(
@@ -138,33 +205,95 @@ class RequestRouter:
             )
             raise
 
-    async def _get_active_adapter(self) -> BaseAdapter:
-        """Get the active adapter based on MCP server configuration."""
+    def _adapter_factory(
+        self, module_name: str, class_name: str, api_keys: List[str]
+    ) -> Callable[[], BaseAdapter]:
+        """
+        Build a factory that imports and instantiates an adapter on demand.
+
+        Args:
+            module_name: Module defining the adapter class
+            class_name: Adapter class name
+            api_keys: API keys for the provider; with more than one, requests are
+                balanced across one adapter per key
+
+        Returns:
+            Zero-arg callable creating the adapter with this router's MCP server
+            and shared HTTP client
+        """
+
+        def create() -> BaseAdapter:
+            adapter_cls = getattr(importlib.import_module(module_name), class_name)
+            adapters = [
+                adapter_cls(self.mcp_server, http_client=self._http_client, api_key=api_key)
+                for api_key in api_keys
+            ]
+            return adapters[0] if len(adapters) == 1 else KeyBalancedAdapter(adapters)
+
+        return create
+
+    def _get_adapter(self, provider: str) -> BaseAdapter:
+        """
+        Get the adapter for a provider, creating and caching it on first use.
+
+        Args:
+            provider: Registered provider name
+
+        Returns:
+            Adapter instance for the provider
+        """
+        adapter = self.adapters.get(provider)
+        if adapter is None:
+            adapter = self.adapters[provider] = self._adapter_factories[provider]()
+            logger.info(event="adapter_instantiated", provider=provider)
+        return adapter
+
+    async def _get_active_adapter(
+        self, config: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, BaseAdapter]:
+        """
+        Get the active adapter based on MCP server configuration.
+
+        Args:
+            config: Active provider config already fetched by the caller; fetched
+                from the MCP server when omitted
+
+        Returns:
+            Tuple of the active provider name and its adapter
+        """
         if not self.mcp_server:
             raise RuntimeError("MCP server not available - cannot determine active provider")
 
         # Get active provider from MCP server
-        config = await self.mcp_server.get_active_provider_config()
+        if config is None:
+            config = await self.mcp_server.get_active_provider_config()
         active_provider = config.get("provider")
 
         if not active_provider:
             raise RuntimeError("No active provider configured in MCP server")
 
+        # Same provider as last time - skip the checks and the selection log
+        cached = self._active_adapter
+        if cached is not None and cached[0] == active_provider:
+            return cached
+
         # Strict mode: fail fast if provider not available
-        if active_provider not in self.adapters:
+        if active_provider not in self.adapters and active_provider not in self._adapter_factories:
             raise ValueError(
                 f"Active provider '{active_provider}' not available. "
-                f"Available providers: {list(self.adapters.keys())}. "
+                f"Available providers: {self.available_providers}. "
                 f"Check your API keys and configuration."
             )
 
+        selected = self._active_adapter = (active_provider, self._get_adapter(active_provider))
+
         logger.info(
             event="active_provider_selected",
             message="Active provider selected from MCP server",
             provider=active_provider,
         )
 
-        return self.adapters[active_provider]
+        return selected
 
     async def get_active_provider_config(self) -> Dict[str, Any]:
         """Get configuration for active provider from MCP server."""
@@ -187,160 +316,110 @@ class RequestRouter:
         """
         Get tools from MCP service (canonical source).
         Router delegates tool management to MCP.
+
+        The tool definitions are static and shared between requests; callers
+        must treat them as read-only.
         """
-        try:
-            logger.info(
-                event="getting_mcp_tools",
-                message="Retrieving MCP tools from service",
-                requested_tools=tool_names,
-            )
+        logger.info(
+            event="getting_mcp_tools",
+            message="Retrieving MCP tools from service",
+            requested_tools=tool_names,
+        )
 
-            # Get ai_configure tool (primary MCP tool)
-            tool_dict = {
-                "name": "ai_configure",
-                "description": "Configure AI model parameters using natural language commands. Supports creative/conservative adjustments, explicit parameter setting, and provider-aware constraints.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "request": {
-                            "type": "string",
-                            "description": "Natural language description of desired parameter changes. Examples: 'make responses more creative', 'set temperature to 0.8', 'reduce randomness and be more focused'",
-                        },
-                        "context": {
-                            "type": "object",
-                            "description": "Additional context for the configuration request",
-                        },
-                        "confidence_threshold": {
-                            "type": "number",
-                            "description": "Minimum confidence required to apply changes automatically (0.0-1.0)",
-                        },
-                    },
-                    "required": ["request"],
-                },
-            }
+        if tool_names:
+            # Filter to requested tools
+            if "ai_configure" in tool_names:
+                logger.info(
+                    event="mcp_tools_filtered",
+                    message="Returning filtered MCP tools",
+                    requested_tools=tool_names,
+                    returned_tools=["ai_configure"],
+                )
+                return [_AI_CONFIGURE_TOOL]
+            else:
+                logger.info(
+                    event="mcp_tools_filtered_empty",
+                    message="No matching MCP tools found",
+                    requested_tools=tool_names,
+                    available_tools=["ai_configure"],
+                )
+                return []
 
-            if tool_names:
-                # Filter to requested tools
-                if "ai_configure" in tool_names:
-                    logger.info(
-                        event="mcp_tools_filtered",
-                        message="Returning filtered MCP tools",
-                        requested_tools=tool_names,
-                        returned_tools=["ai_configure"],
-                    )
-                    return [tool_dict]
-                else:
-                    logger.info(
-                        event="mcp_tools_filtered_empty",
-                        message="No matching MCP tools found",
-                        requested_tools=tool_names,
-                        available_tools=["ai_configure"],
-                    )
-                    return []
+        logger.info(
+            event="mcp_tools_returned",
+            message="Returning all available MCP tools",
+            tools_count=1,
+            tools=["ai_configure"],
+        )
 
-            logger.info(
-                event="mcp_tools_returned",
-                message="Returning all available MCP tools",
-                tools_count=1,
-                tools=["ai_configure"],
-                full_tool_definition=tool_dict,
-            )
+        return [_AI_CONFIGURE_TOOL]
 
-            return [tool_dict]
+    async def health_check_all_providers(self) -> Dict[str, bool]:
+        """
+        Check health of all configured providers concurrently.
 
-        except Exception as e:
-            logger.error(event="mcp_tools_error", message="Failed to get MCP tools", error=str(e))
-            return []
+        Each check is capped at HEALTH_CHECK_TIMEOUT seconds so one stalled
+        provider cannot hold up the others.
 
-    async def health_check_all_providers(self) -> Dict[str, bool]:
-        """Check health of all configured providers."""
-        health_status = {}
+        Returns:
+            Health status per provider name
+        """
+        names = self.available_providers
+        results = await asyncio.gather(
+            *(self._check_provider_health(name) for name in names),
+            return_exceptions=True,
+        )
 
-        for name, adapter in self.adapters.items():
-            try:
-                health_status[name] = await adapter.health_check()
-                logger.info(
-                    event="provider_health_check",
-                    provider=name,
-                    healthy=health_status[name],
-                )
-            except Exception as e:
+        health_status = {}
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, BaseException):
                 logger.error(
                     event="provider_health_check_failed",
                     provider=name,
-                    error=str(e),
+                    error=(
+                        f"Health check timed out after {HEALTH_CHECK_TIMEOUT}s"
+                        if isinstance(result, asyncio.TimeoutError)
+                        else str(result)
+                    ),
                 )
                 health_status[name] = False
+            else:
+                health_status[name] = result
+                logger.info(
+                    event="provider_health_check",
+                    provider=name,
+                    healthy=result,
+                )
 
         return health_status
 
-    async def process_request(
-        self, router_request: RouterRequest
-    ) -> AsyncGenerator[WebSocketResponse, None]:
+    async def _check_provider_health(self, provider: str) -> bool:
+        """Run one provider's health check, creating its adapter if needed."""
+        adapter = self._get_adapter(provider)
+        return await asyncio.wait_for(adapter.health_check(), timeout=HEALTH_CHECK_TIMEOUT)
+
+    def process_request(self, router_request: RouterRequest) -> AsyncIterator[WebSocketResponse]:
         """
-        Process a request and yield streaming responses.
+        Process a request and stream its responses.
+
+        The handler's generator is iterated directly by the caller through a
+        _RoutedStream, so each response passes through a single generator frame.
 
         Args:
             router_request: The request to process
 
-        Yields:
-            WebSocketResponse objects for streaming back to client
+        Returns:
+            Async iterator of WebSocketResponse objects for streaming back to client
         """
-        with TimedLogger(
-            logger,
-            "request_processed",
-            request_id=router_request.request_id,
-            request_type=router_request.request_type.value,
-        ):
-            try:
-                # Route based on request type
-                if router_request.request_type == RequestType.CHAT:
-                    async for response in self._handle_chat_request(router_request):
-                        yield response
-                elif router_request.request_type == RequestType.IMAGE_GENERATION:
-                    async for response in self._handle_image_request(router_request):
-                        yield response
-                elif router_request.request_type == RequestType.AUDIO_STREAM:
-                    async for response in self._handle_audio_request(router_request):
-                        yield response
-                elif router_request.request_type == RequestType.FRONTEND_COMMAND:
-                    async for response in self._handle_frontend_command(router_request):
-                        yield response
-                elif router_request.request_type == RequestType.MCP_REQUEST:
-                    async for response in self._handle_mcp_request(router_request):
-                        yield response
-                else:
-                    # Unknown request type
-                    yield WebSocketResponse(
-                        request_id=router_request.request_id,
-                        status="error",
-                        error=f"Unknown request type: {router_request.request_type}",
-                    )
+        # Route based on request type
+        handler = self._dispatch.get(router_request.request_type, self._handle_unknown_request)
+        return _RoutedStream(self, router_request, handler(router_request))
 
-            except asyncio.TimeoutError:
-                logger.warning(
-                    event="request_timeout",
-                    message="Request timeout",
-                    request_id=router_request.request_id,
-                    timeout=self.config.router.request_timeout,
-                )
-                yield WebSocketResponse(
-                    request_id=router_request.request_id,
-                    status="error",
-                    error=f"Request timeout after {self.config.router.request_timeout}s",
-                )
-            except Exception as e:
-                logger.error(
-                    event="request_failed",
-                    message="Request processing failed",
-                    request_id=router_request.request_id,
-                    error=str(e),
-                )
-                yield WebSocketResponse(
-                    request_id=router_request.request_id,
-                    status="error",
-                    error=f"Request processing failed: {str(e)}",
-                )
+    async def _handle_unknown_request(
+        self, request: RouterRequest
+    ) -> AsyncGenerator[WebSocketResponse, None]:
+        """Reject requests whose type has no registered handler."""
+        yield _error_response(request.request_id, f"Unknown request type: {request.request_type}")
 
     async def _handle_chat_request(
         self, request: RouterRequest
@@ -351,12 +430,11 @@ class RequestRouter:
 
         # Get active adapter with fallback logic
         try:
-            # Get active adapter
-            active_adapter = await self._get_active_adapter()
-
             # Get configuration from MCP service
             mcp_config = await self.get_active_provider_config()
-            provider_name = mcp_config.get("provider", self.config.providers.active)
+
+            # Get active adapter for the same config snapshot
+            provider_name, active_adapter = await self._get_active_adapter(mcp_config)
 
             system_prompt = mcp_config.get("system_prompt", "You are a helpful AI assistant.")
             temperature = mcp_config.get("temperature", 0.7)
@@ -373,8 +451,14 @@ class RequestRouter:
                 mcp_tools_available=bool(mcp_tools),
                 mcp_tools_count=len(mcp_tools) if mcp_tools else 0,
                 mcp_tool_names=[tool.get("name") for tool in mcp_tools] if mcp_tools else [],
-                detailed_tools=mcp_tools,  # Log full tool definitions
             )
+            # Full tool definitions (descriptions and schemas) only when debugging
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    event="mcp_tools_detail",
+                    request_id=request.request_id,
+                    detailed_tools=mcp_tools,
+                )
 
             adapter_request = AdapterRequest(
                 messages=[{"role": "user", "content": text_input}],
@@ -413,17 +497,55 @@ class RequestRouter:
                 request_id=request.request_id,
                 error=str(e),
             )
-            yield WebSocketResponse(
-                request_id=request.request_id,
-                status="error",
-                error=str(e),
-            )
+            yield _error_response(request.request_id, str(e))
             return
 
-        try:
-            async for adapter_response in active_adapter.chat_completion(adapter_request):  # type: ignore
-                # Log every adapter response for debugging
+        # Opt-in replay of an identical earlier request; tool-calling responses are
+        # never stored since their tools have side effects
+        cache_key = None
+        if request.payload.get("allow_cache", False):
+            cache_key = ResponseCache.key(provider_name, model_name, adapter_request)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
                 logger.info(
+                    event="chat_response_cache_hit",
+                    request_id=request.request_id,
+                    provider=provider_name,
+                    chunks=len(cached),
+                )
+                for content, metadata in cached:
+                    yield WebSocketResponse.model_construct(
+                        request_id=request.request_id,
+                        status="chunk",
+                        chunk=Chunk.model_construct(
+                            type=ChunkType.TEXT, data=content, metadata=metadata
+                        ),
+                    )
+                yield _complete_response(request.request_id)
+                return
+        # Chunks streamed so far, kept for the cache until a tool call rules it out
+        recorded: Optional[List[CachedChunk]] = [] if cache_key else None
+
+        # Chunk metadata shared by every streamed token; adapter metadata is merged in
+        # only when a response carries some
+        base_meta = {"source": provider_name, "model": model_name}
+        follow_up_meta = {
+            **base_meta,
+            "type": "mcp_tool_execution_explanation",
+            "mcp_compliant": True,
+        }
+
+        # Per-chunk logs are debug-only; resolve the level once for the whole stream
+        debug = _stdlib_logger.isEnabledFor(logging.DEBUG)
+
+        # Streaming failures propagate to _RoutedStream, which logs them and
+        # yields the error response
+        async for adapter_response in _coalesce_content(
+            active_adapter.chat_completion(adapter_request)  # type: ignore
+        ):
+            # Log every adapter response for debugging
+            if debug:
+                logger.debug(
                     event="adapter_response_received",
                     message="Received response from adapter",
                     request_id=request.request_id,
@@ -434,23 +556,29 @@ class RequestRouter:
                     metadata=adapter_response.metadata,
                 )
 
-                # Handle content streaming
-                if adapter_response.content:
-                    websocket_response = WebSocketResponse(
-                        request_id=request.request_id,
-                        status="chunk",
-                        chunk=Chunk(
-                            type=ChunkType.TEXT,
-                            data=adapter_response.content,
-                            metadata={
-                                "source": provider_name,
-                                "model": model_name,
-                                **adapter_response.metadata,
-                            },
-                        ),
-                    )
+            # Handle content streaming
+            if adapter_response.content:
+                chunk_meta = (
+                    {**base_meta, **adapter_response.metadata}
+                    if adapter_response.metadata
+                    else base_meta
+                )
+                if recorded is not None:
+                    recorded.append((adapter_response.content, chunk_meta))
 
-                    logger.info(
+                # Content was validated by AdapterResponse; construct without re-validating
+                websocket_response = WebSocketResponse.model_construct(
+                    request_id=request.request_id,
+                    status="chunk",
+                    chunk=Chunk.model_construct(
+                        type=ChunkType.TEXT,
+                        data=adapter_response.content,
+                        metadata=chunk_meta,
+                    ),
+                )
+
+                if debug:
+                    logger.debug(
                         event="websocket_response_yielding",
                         message="Yielding content chunk to WebSocket",
                         request_id=request.request_id,
@@ -462,230 +590,81 @@ class RequestRouter:
                         ),
                     )
 
-                    yield websocket_response
+                yield websocket_response
 
-                # Handle tool calls - EXECUTE LOCALLY VIA MCP 2025, DON'T SEND TO FRONTEND
-                if adapter_response.tool_calls:
-                    logger.info(
-                        event="tool_calls_received_for_mcp_execution",
-                        message="Executing tool calls locally via MCP 2025 protocol",
-                        request_id=request.request_id,
-                        tool_count=len(adapter_response.tool_calls),
-                        tool_names=[
-                            tc.get("name", "unknown") for tc in adapter_response.tool_calls
-                        ],
-                    )
-
-                    # Execute each tool call through MCP 2025 server
-                    tool_results = []
-                    for tool_call in adapter_response.tool_calls:
-                        tool_name = tool_call.get("name")
-                        tool_arguments = tool_call.get("arguments", {})
-                        tool_id = tool_call.get("id", f"call_{len(adapter_response.tool_calls)}")
-
-                        logger.info(
-                            event="executing_tool_via_mcp2025",
-                            message="Executing tool call via MCP 2025 protocol",
-                            request_id=request.request_id,
-                            tool_name=tool_name,
-                            tool_id=tool_id,
-                        )
-
-                        try:
-                            # Execute through MCP 2025 server for full compliance
-                            from mcp.mcp2025_server import get_mcp2025_server
-                            from mcp.jsonrpc import JSONRPCHandler, MCPMethods, MCPToolsCallParams
-
-                            mcp_server = get_mcp2025_server()
-
-                            # Parse JSON arguments if they come as string
-                            if isinstance(tool_arguments, str):
-                                import json
-
-                                try:
-                                    tool_arguments = json.loads(tool_arguments)
-                                except json.JSONDecodeError:
-                                    tool_arguments = {"request": tool_arguments}
-
-                            # Create MCP 2025 compliant tool call request
-                            mcp_request = JSONRPCHandler.create_request(
-                                id=f"mcp-{tool_id}",
-                                method=MCPMethods.TOOLS_CALL,
-                                params=MCPToolsCallParams(
-                                    name=tool_name, arguments=tool_arguments
-                                ).model_dump(),
-                            )
-
-                            # Execute through MCP 2025 server
-                            mcp_response = await mcp_server._handle_request(mcp_request)
-
-                            # Type-safe response handling
-                            from mcp.jsonrpc import JSONRPCResponse, JSONRPCErrorResponse
-
-                            if isinstance(mcp_response, JSONRPCResponse):
-                                # Success - extract content from MCP response
-                                result_data = mcp_response.result
-                                result_content = (
-                                    result_data.get("content", [])
-                                    if isinstance(result_data, dict)
-                                    else []
-                                )
-                                result_text = []
-
-                                # Extract text from multi-type content
-                                for content_item in result_content:
-                                    if (
-                                        isinstance(content_item, dict)
-                                        and content_item.get("type") == "text"
-                                    ):
-                                        result_text.append(content_item.get("text", ""))
-
-                                success_message = (
-                                    "\n".join(result_text) or "Tool executed successfully"
-                                )
-
-                                logger.info(
-                                    event="mcp_tool_execution_success",
-                                    message="Tool executed successfully via MCP 2025",
-                                    request_id=request.request_id,
-                                    tool_name=tool_name,
-                                    content_types=[
-                                        c.get("type") for c in result_content if isinstance(c, dict)
-                                    ],
-                                )
-
-                                tool_results.append(
-                                    {
-                                        "tool_call_id": tool_id,
-                                        "result": success_message,
-                                        "success": True,
-                                        "mcp_content": result_content,  # Full MCP content for debugging
-                                    }
-                                )
-
-                            elif isinstance(mcp_response, JSONRPCErrorResponse):
-                                # Error - extract error message
-                                error_message = (
-                                    mcp_response.error.message
-                                    if mcp_response.error
-                                    else "Tool execution failed"
-                                )
-
-                                logger.error(
-                                    event="mcp_tool_execution_failed",
-                                    message="Tool execution failed via MCP 2025",
-                                    request_id=request.request_id,
-                                    tool_name=tool_name,
-                                    error=error_message,
-                                )
-
-                                tool_results.append(
-                                    {
-                                        "tool_call_id": tool_id,
-                                        "result": f"Tool execution failed: {error_message}",
-                                        "success": False,
-                                    }
-                                )
-
-                            else:
-                                # Unexpected response type
-                                logger.error(
-                                    event="mcp_unexpected_response",
-                                    message="Unexpected MCP response type",
-                                    request_id=request.request_id,
-                                    tool_name=tool_name,
-                                    response_type=type(mcp_response).__name__,
-                                )
-
-                                tool_results.append(
-                                    {
-                                        "tool_call_id": tool_id,
-                                        "result": "Tool execution failed: Unexpected response format",
-                                        "success": False,
-                                    }
-                                )
-
-                        except Exception as e:
-                            logger.error(
-                                event="mcp_tool_execution_exception",
-                                message="Exception during MCP 2025 tool execution",
-                                request_id=request.request_id,
-                                tool_name=tool_name,
-                                error=str(e),
-                            )
-
-                            tool_results.append(
-                                {
-                                    "tool_call_id": tool_id,
-                                    "result": f"Tool execution error: {str(e)}",
-                                    "success": False,
-                                }
-                            )
+            # Handle tool calls - EXECUTE LOCALLY VIA MCP 2025, DON'T SEND TO FRONTEND
+            if adapter_response.tool_calls:
+                recorded = None
+                logger.info(
+                    event="tool_calls_received_for_mcp_execution",
+                    message="Executing tool calls locally via MCP 2025 protocol",
+                    request_id=request.request_id,
+                    tool_count=len(adapter_response.tool_calls),
+                    tool_names=[tc.get("name", "unknown") for tc in adapter_response.tool_calls],
+                )
 
-                    # Continue conversation with LLM following MCP best practices
-                    # Construct proper tool result messages for LLM continuation
-                    tool_result_messages = []
-                    for result in tool_results:
-                        tool_result_messages.append(
-                            {
-                                "role": "tool",
-                                "tool_call_id": result["tool_call_id"],
-                                "content": result["result"],
-                            }
-                        )
-
-                    # Build complete conversation history with tool results
-                    complete_messages = adapter_request.messages.copy()
-
-                    # Add assistant message with tool calls
-                    assistant_message: Dict[str, Any] = {"role": "assistant", "content": ""}
-                    if adapter_response.content:
-                        assistant_message["content"] = adapter_response.content
-
-                    # Format tool calls for OpenAI API requirements
-                    if adapter_response.tool_calls:
-                        formatted_tool_calls = []
-                        for tool_call in adapter_response.tool_calls:
-                            formatted_tool_call = {
-                                "id": tool_call["id"],
-                                "type": "function",
-                                "function": {
-                                    "name": tool_call["name"],
-                                    "arguments": tool_call["arguments"],
-                                },
-                            }
-                            formatted_tool_calls.append(formatted_tool_call)
-                        assistant_message["tool_calls"] = formatted_tool_calls
-
-                    complete_messages.append(assistant_message)
-
-                    # Add tool result messages
-                    complete_messages.extend(tool_result_messages)
-
-                    # Create follow-up request for LLM to process tool results
-                    follow_up_request = AdapterRequest(
-                        messages=complete_messages,
-                        temperature=adapter_request.temperature,
-                        max_tokens=adapter_request.max_tokens,
-                        system_prompt=adapter_request.system_prompt,
-                        mcp_tools=None,  # Disable tools for follow-up to prevent infinite loops
+                # Execute the tool calls concurrently through the MCP 2025 server this
+                # router was built with; results keep the order of the calls
+                default_id = f"call_{len(adapter_response.tool_calls)}"
+                tool_results = await asyncio.gather(
+                    *(
+                        self._execute_tool_call(tool_call, default_id, request.request_id)
+                        for tool_call in adapter_response.tool_calls
                     )
+                )
 
-                    logger.info(
-                        event="continuing_conversation_with_mcp_results",
-                        message="Continuing conversation with LLM after MCP tool execution",
-                        request_id=request.request_id,
-                        tool_results_count=len(tool_results),
-                        successful_tools=sum(1 for r in tool_results if r["success"]),
-                    )
+                # Continue conversation with LLM following MCP best practices
+                # Construct proper tool result messages for LLM continuation
+                tool_result_messages = [
+                    {"role": "tool", "tool_call_id": result.tool_call_id, "content": result.result}
+                    for result in tool_results
+                ]
+
+                # Add assistant message with tool calls, formatted for OpenAI API requirements
+                assistant_message: Dict[str, Any] = {
+                    "role": "assistant",
+                    "content": adapter_response.content or "",
+                    "tool_calls": [
+                        {
+                            "id": tool_call["id"],
+                            "type": "function",
+                            "function": {
+                                "name": tool_call["name"],
+                                "arguments": tool_call["arguments"],
+                            },
+                        }
+                        for tool_call in adapter_response.tool_calls
+                    ],
+                }
+
+                # Create follow-up request for LLM to process tool results, with the
+                # complete conversation history built in one list. The history was
+                # validated with adapter_request and the rest is built here, so the
+                # messages are not validated (and copied) again.
+                follow_up_request = AdapterRequest.model_construct(
+                    messages=[*adapter_request.messages, assistant_message, *tool_result_messages],
+                    temperature=adapter_request.temperature,
+                    max_tokens=adapter_request.max_tokens,
+                    system_prompt=adapter_request.system_prompt,
+                    mcp_tools=None,  # Disable tools for follow-up to prevent infinite loops
+                )
 
-                    # Continue conversation with LLM to get explanation/summary
-                    try:
-                        async for follow_up_response in active_adapter.chat_completion(
-                            follow_up_request
-                        ):  # type: ignore
-                            # Log follow-up response
-                            logger.info(
+                logger.info(
+                    event="continuing_conversation_with_mcp_results",
+                    message="Continuing conversation with LLM after MCP tool execution",
+                    request_id=request.request_id,
+                    tool_results_count=len(tool_results),
+                    successful_tools=sum(1 for r in tool_results if r.success),
+                )
+
+                # Continue conversation with LLM to get explanation/summary
+                try:
+                    async for follow_up_response in _coalesce_content(
+                        active_adapter.chat_completion(follow_up_request)  # type: ignore
+                    ):
+                        # Log follow-up response
+                        if debug:
+                            logger.debug(
                                 event="mcp_follow_up_response_received",
                                 message="Received follow-up response after MCP tool execution",
                                 request_id=request.request_id,
@@ -697,105 +676,161 @@ class RequestRouter:
                                 ),
                             )
 
-                            # Forward follow-up content to frontend
-                            if follow_up_response.content:
-                                websocket_response = WebSocketResponse(
-                                    request_id=request.request_id,
-                                    status="chunk",
-                                    chunk=Chunk(
-                                        type=ChunkType.TEXT,
-                                        data=follow_up_response.content,
-                                        metadata={
-                                            "source": provider_name,
-                                            "model": model_name,
-                                            "type": "mcp_tool_execution_explanation",
-                                            "mcp_compliant": True,
-                                        },
-                                    ),
-                                )
+                        # Forward follow-up content to frontend
+                        if follow_up_response.content:
+                            # Validated by AdapterResponse, as above
+                            websocket_response = WebSocketResponse.model_construct(
+                                request_id=request.request_id,
+                                status="chunk",
+                                chunk=Chunk.model_construct(
+                                    type=ChunkType.TEXT,
+                                    data=follow_up_response.content,
+                                    metadata=follow_up_meta,
+                                ),
+                            )
 
-                                logger.info(
+                            if debug:
+                                logger.debug(
                                     event="mcp_follow_up_content_yielding",
                                     message="Yielding MCP-compliant follow-up content to WebSocket",
                                     request_id=request.request_id,
                                     chunk_length=len(follow_up_response.content),
                                 )
 
-                                yield websocket_response
+                            yield websocket_response
 
-                            # Handle follow-up completion
-                            if follow_up_response.finish_reason:
-                                logger.info(
-                                    event="mcp_follow_up_completion",
-                                    message="MCP-compliant follow-up conversation completed",
-                                    request_id=request.request_id,
-                                    finish_reason=follow_up_response.finish_reason,
-                                )
-                                break
-
-                    except Exception as e:
-                        logger.error(
-                            event="mcp_follow_up_error",
-                            message="Error in MCP follow-up conversation",
-                            request_id=request.request_id,
-                            error=str(e),
-                        )
-
-                        # Send error response to frontend
-                        yield WebSocketResponse(
-                            request_id=request.request_id,
-                            status="error",
-                            error=f"MCP follow-up conversation failed: {str(e)}",
-                        )
-                        return
-
-                    # MCP tool execution and explanation complete
-                    logger.info(
-                        event="mcp_tool_flow_completed",
-                        message="Complete MCP tool execution flow finished",
+                        # Handle follow-up completion
+                        if follow_up_response.finish_reason:
+                            logger.info(
+                                event="mcp_follow_up_completion",
+                                message="MCP-compliant follow-up conversation completed",
+                                request_id=request.request_id,
+                                finish_reason=follow_up_response.finish_reason,
+                            )
+                            break
+
+                except Exception as e:
+                    logger.error(
+                        event="mcp_follow_up_error",
+                        message="Error in MCP follow-up conversation",
                         request_id=request.request_id,
-                        tools_executed=len(tool_results),
+                        error=str(e),
                     )
 
-                    # Return here as we've completed the full MCP flow
+                    # Send error response to frontend
+                    yield _error_response(
+                        request.request_id, f"MCP follow-up conversation failed: {str(e)}"
+                    )
                     return
 
-                # Handle completion
-                if adapter_response.finish_reason:
-                    logger.info(
-                        event="completion_received",
-                        message="Received completion from adapter",
-                        request_id=request.request_id,
-                        finish_reason=adapter_response.finish_reason,
-                    )
+                # MCP tool execution and explanation complete
+                logger.info(
+                    event="mcp_tool_flow_completed",
+                    message="Complete MCP tool execution flow finished",
+                    request_id=request.request_id,
+                    tools_executed=len(tool_results),
+                )
 
-                    # Send completion
-                    completion_response = WebSocketResponse(
-                        request_id=request.request_id, status="complete"
-                    )
+                # Return here as we've completed the full MCP flow
+                return
 
-                    logger.info(
-                        event="completion_websocket_response",
-                        message="Yielding completion to WebSocket",
-                        request_id=request.request_id,
-                    )
+            # Handle completion
+            if adapter_response.finish_reason:
+                logger.info(
+                    event="completion_received",
+                    message="Received completion from adapter",
+                    request_id=request.request_id,
+                    finish_reason=adapter_response.finish_reason,
+                )
 
-                    yield completion_response
-                    break
+                if cache_key and recorded is not None:
+                    self._response_cache.put(cache_key, recorded)
+
+                # Send completion
+                completion_response = _complete_response(request.request_id)
+
+                logger.info(
+                    event="completion_websocket_response",
+                    message="Yielding completion to WebSocket",
+                    request_id=request.request_id,
+                )
+
+                yield completion_response
+                break
+
+    async def _execute_tool_call(
+        self, tool_call: Dict[str, Any], default_id: str, request_id: str
+    ) -> ToolResult:
+        """
+        Execute one model tool call through the MCP 2025 server.
+
+        Args:
+            tool_call: Tool call from the adapter (id, name, arguments)
+            default_id: Tool call ID to use when the call has none
+            request_id: Request ID for logging
+
+        Returns:
+            Tool result; failures are reported in the result rather than raised
+        """
+        tool_name = tool_call.get("name")
+        tool_arguments = tool_call.get("arguments", {})
+        tool_id = tool_call.get("id", default_id)
+
+        logger.info(
+            event="executing_tool_via_mcp2025",
+            message="Executing tool call via MCP 2025 protocol",
+            request_id=request_id,
+            tool_name=tool_name,
+            tool_id=tool_id,
+        )
+
+        try:
+            # Parse JSON arguments if they come as string
+            if isinstance(tool_arguments, str):
+                try:
+                    tool_arguments = loads(tool_arguments)
+                except JSONDecodeError:
+                    tool_arguments = {"request": tool_arguments}
+
+            if tool_arguments is None:
+                tool_arguments = {}
+            elif not isinstance(tool_arguments, dict):
+                raise ValueError(
+                    f"Tool arguments must be an object, got {type(tool_arguments).__name__}"
+                )
+
+            # Call the in-process MCP 2025 server directly, without a JSON-RPC envelope
+            result_data = await self.mcp_server.call_tool(tool_name, tool_arguments)  # type: ignore
+            result_content = result_data["content"]
+            result_text = []
+
+            # Extract text from multi-type content
+            for content_item in result_content:
+                if content_item.get("type") == "text":
+                    result_text.append(content_item.get("text", ""))
+
+            success_message = "\n".join(result_text) or "Tool executed successfully"
+
+            logger.info(
+                event="mcp_tool_execution_success",
+                message="Tool executed successfully via MCP 2025",
+                request_id=request_id,
+                tool_name=tool_name,
+                content_types=[c.get("type") for c in result_content],
+            )
+
+            return ToolResult(tool_id, success_message, True, result_content)
 
         except Exception as e:
             logger.error(
-                event="chat_request_error",
-                message="Chat request processing failed",
-                request_id=request.request_id,
-                provider=provider_name,
+                event="mcp_tool_execution_exception",
+                message="Exception during MCP 2025 tool execution",
+                request_id=request_id,
+                tool_name=tool_name,
                 error=str(e),
             )
-            yield WebSocketResponse(
-                request_id=request.request_id,
-                status="error",
-                error=f"Chat processing failed: {str(e)}",
-            )
+
+            return ToolResult(tool_id, f"Tool execution error: {str(e)}", False)
 
     async def _handle_image_request(
         self, request: RouterRequest
@@ -812,19 +847,21 @@ class RequestRouter:
         )
 
         # Simulate image generation delay
-        await asyncio.sleep(1.0)
+        if self.config.router.simulation_mode:
+            await asyncio.sleep(self.config.router.image_gen_delay)
 
-        yield WebSocketResponse(
+        # Fields are built here or typed Any, so skip validation
+        yield WebSocketResponse.model_construct(
             request_id=request.request_id,
             status="chunk",
-            chunk=Chunk(
+            chunk=Chunk.model_construct(
                 type=ChunkType.TEXT,
                 data=f"🎨 Simulated image generation for prompt: '{prompt}'",
                 metadata={"source": "router_simulation", "type": "image_placeholder"},
             ),
         )
 
-        yield WebSocketResponse(request_id=request.request_id, status="complete")
+        yield _complete_response(request.request_id)
 
     async def _handle_audio_request(
         self, request: RouterRequest
@@ -843,13 +880,16 @@ class RequestRouter:
         )
 
         # Simulate TTS processing delay
-        await asyncio.sleep(0.8)
+        simulate = self.config.router.simulation_mode
+        if simulate:
+            await asyncio.sleep(self.config.router.audio_start_delay)
 
         # Send metadata about audio generation
-        yield WebSocketResponse(
+        # Fields are built here or typed Any, so skip validation
+        yield WebSocketResponse.model_construct(
             request_id=request.request_id,
             status="chunk",
-            chunk=Chunk(
+            chunk=Chunk.model_construct(
                 type=ChunkType.METADATA,
                 data=f"🔊 Generating audio for voice: {voice}",
                 metadata={
@@ -863,24 +903,22 @@ class RequestRouter:
 
         # Simulate audio data chunks (in real implementation, this would be actual audio data)
         audio_chunks = ["chunk1_base64", "chunk2_base64", "chunk3_base64"]
+        # Metadata shared by every chunk; only chunk_index varies
+        base_meta = {"total_chunks": len(audio_chunks), "audio_format": "mp3", "sample_rate": 22050}
         for i, chunk_data in enumerate(audio_chunks):
-            await asyncio.sleep(0.3)
-            yield WebSocketResponse(
+            if simulate:
+                await asyncio.sleep(self.config.router.audio_chunk_delay)
+            yield WebSocketResponse.model_construct(
                 request_id=request.request_id,
                 status="chunk",
-                chunk=Chunk(
+                chunk=Chunk.model_construct(
                     type=ChunkType.BINARY,
                     data=f"simulated_audio_data_{i}",
-                    metadata={
-                        "chunk_index": i,
-                        "total_chunks": len(audio_chunks),
-                        "audio_format": "mp3",
-                        "sample_rate": 22050,
-                    },
+                    metadata={"chunk_index": i, **base_meta},
                 ),
             )
 
-        yield WebSocketResponse(request_id=request.request_id, status="complete")
+        yield _complete_response(request.request_id)
 
     async def _handle_frontend_command(
         self, request: RouterRequest
@@ -898,19 +936,21 @@ class RequestRouter:
         )
 
         # Simulate frontend command processing
-        await asyncio.sleep(0.1)
+        if self.config.router.simulation_mode:
+            await asyncio.sleep(self.config.router.frontend_command_delay)
 
-        yield WebSocketResponse(
+        # Fields are built here or typed Any, so skip validation
+        yield WebSocketResponse.model_construct(
             request_id=request.request_id,
             status="chunk",
-            chunk=Chunk(
+            chunk=Chunk.model_construct(
                 type=ChunkType.METADATA,
                 data=f"📱 Executing frontend command: {command}",
                 metadata={"source": "router_simulation", "command": command, "command_data": data},
             ),
         )
 
-        yield WebSocketResponse(request_id=request.request_id, status="complete")
+        yield _complete_response(request.request_id)
 
     async def _handle_mcp_request(
         self, request: RouterRequest
@@ -924,58 +964,272 @@ class RequestRouter:
             payload_keys=list(request.payload.keys()),
         )
 
+        # Self-configuration service removed in simplified approach
+        # LLM now handles configuration directly through MCP tools
+
+        # Return a simple message explaining the new approach
+        result = {
+            "message": "Configuration is now handled directly by the LLM using MCP tools. Simply ask me to adjust my settings in natural language.",
+            "status": "info",
+            "mcp_tools_available": [
+                "ai_configure",
+                "show_current_config",
+                "list_available_models",
+                "switch_provider",
+                "reset_config",
+            ],
+        }
+
+        # Send the MCP response as a chunk
+        # Static result built here, so skip validation
+        yield WebSocketResponse.model_construct(
+            request_id=request.request_id,
+            status="chunk",
+            chunk=Chunk.model_construct(
+                type=ChunkType.METADATA,
+                data=result.get("message", result),
+                metadata={
+                    "source": "mcp_service",
+                    "mcp_status": result.get("status", "unknown"),
+                    "confidence": result.get("confidence"),
+                    "mcp_type": "configuration",
+                },
+            ),
+        )
+
+        # Send completion
+        yield _complete_response(request.request_id)
+
+    async def shutdown(self) -> None:
+        """Gracefully shutdown the router and cleanup resources."""
+        logger.info(event="router_shutdown", message="Router shutting down")
+
+        # Close all created adapters concurrently; a stuck one must not block shutdown
+        providers = list(self.adapters)
         try:
-            # Self-configuration service removed in simplified approach
-            # LLM now handles configuration directly through MCP tools
-
-            # Return a simple message explaining the new approach
-            result = {
-                "message": "Configuration is now handled directly by the LLM using MCP tools. Simply ask me to adjust my settings in natural language.",
-                "status": "info",
-                "mcp_tools_available": [
-                    "ai_configure",
-                    "show_current_config",
-                    "list_available_models",
-                    "switch_provider",
-                    "reset_config",
-                ],
-            }
-
-            # Send the MCP response as a chunk
-            yield WebSocketResponse(
-                request_id=request.request_id,
-                status="chunk",
-                chunk=Chunk(
-                    type=ChunkType.METADATA,
-                    data=result.get("message", result),
-                    metadata={
-                        "source": "mcp_service",
-                        "mcp_status": result.get("status", "unknown"),
-                        "confidence": result.get("confidence"),
-                        "mcp_type": "configuration",
-                    },
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(self.adapters[provider].aclose() for provider in providers),
+                    return_exceptions=True,
                 ),
+                timeout=SHUTDOWN_TIMEOUT,
             )
+        except asyncio.TimeoutError:
+            logger.error(
+                event="adapter_shutdown_timeout",
+                message=f"Adapters did not close within {SHUTDOWN_TIMEOUT}s",
+                providers=providers,
+            )
+        else:
+            for provider, result in zip(providers, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        event="adapter_shutdown_failed",
+                        provider=provider,
+                        error=str(result),
+                    )
+
+        self.adapters.clear()
+        self._response_cache.clear()
+        self._active_adapter = None
+
+        # Close the connection pool shared by all adapters
+        await self._http_client.aclose()
+
+
+def _api_keys(env_var: str) -> List[str]:
+    """
+    Read a provider's API keys from the environment.
 
-            # Send completion
-            yield WebSocketResponse(request_id=request.request_id, status="complete")
+    Args:
+        env_var: Single-key variable name, e.g. OPENAI_API_KEY
 
+    Returns:
+        Distinct keys from the comma-separated <env_var>S variable (e.g.
+        OPENAI_API_KEYS) if set, otherwise the single key, or an empty list
+    """
+    keys = [key.strip() for key in os.getenv(f"{env_var}S", "").split(",")]
+    keys = list(dict.fromkeys(key for key in keys if key))
+    if not keys and os.getenv(env_var):
+        keys.append(os.environ[env_var])
+    return keys
+
+
+def _complete_response(request_id: str) -> WebSocketResponse:
+    """Build the terminal "complete" frame; both fields are known strings, so skip validation."""
+    return WebSocketResponse.model_construct(request_id=request_id, status="complete")
+
+
+def _error_response(request_id: str, error: str) -> WebSocketResponse:
+    """Build an error frame; both fields are known strings, so skip validation."""
+    return WebSocketResponse.model_construct(request_id=request_id, status="error", error=error)
+
+
+async def _coalesce_content(
+    responses: AsyncIterator[AdapterResponse],
+) -> AsyncGenerator[AdapterResponse, None]:
+    """
+    Merge consecutive text-only adapter responses into larger ones.
+
+    Token-sized pieces are buffered until STREAM_COALESCE_CHARS characters or
+    STREAM_COALESCE_SECONDS have accumulated, so each client chunk carries more
+    text. The time limit is enforced while waiting on the provider, so a stall
+    never holds buffered text back. Responses with tool calls or a finish reason
+    flush the buffer and are passed through unchanged.
+
+    Args:
+        responses: Adapter response stream
+
+    Yields:
+        Adapter responses; merged ones carry the metadata of their last piece
+    """
+    loop = asyncio.get_running_loop()
+    iterator = responses.__aiter__()
+    parts: List[str] = []
+    size = 0
+    deadline = 0.0
+    metadata: Dict[str, Any] = {}
+    # Read of the next response, run as a task only while text is buffered so the
+    # wait can time out without cancelling the provider stream
+    pending: Optional["asyncio.Future[AdapterResponse]"] = None
+
+    try:
+        while True:
+            if pending is None and not parts:
+                try:
+                    response = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+            else:
+                if pending is None:
+                    pending = asyncio.ensure_future(iterator.__anext__())
+                timeout = max(deadline - loop.time(), 0.0) if parts else None
+                done, _ = await asyncio.wait((pending,), timeout=timeout)
+                if not done:
+                    # Provider stalled past the deadline - send what is buffered
+                    yield _merged_response(parts, metadata)
+                    parts = []
+                    size = 0
+                    continue
+                step, pending = pending, None
+                try:
+                    response = step.result()
+                except StopAsyncIteration:
+                    break
+
+            content = response.content
+            if content and not response.tool_calls and not response.finish_reason:
+                if not parts:
+                    deadline = loop.time() + STREAM_COALESCE_SECONDS
+                parts.append(content)
+                size += len(content)
+                metadata = response.metadata
+                if size >= STREAM_COALESCE_CHARS or loop.time() >= deadline:
+                    yield _merged_response(parts, metadata)
+                    parts = []
+                    size = 0
+                continue
+
+            if parts:
+                yield _merged_response(parts, metadata)
+                parts = []
+                size = 0
+            yield response
+
+        if parts:
+            yield _merged_response(parts, metadata)
+    finally:
+        if pending is not None:
+            pending.cancel()
+            # A read that already finished has its outcome marked as retrieved
+            if pending.done() and not pending.cancelled():
+                pending.exception()
+
+
+def _merged_response(parts: List[str], metadata: Dict[str, Any]) -> AdapterResponse:
+    """Build one text response from buffered pieces already validated by AdapterResponse."""
+    return AdapterResponse.model_construct(content="".join(parts), metadata=metadata)
+
+
+class _RoutedStream:
+    """
+    Async iterator over a request handler's responses.
+
+    Applies the router's timing and error handling around each step of the
+    handler's generator, instead of re-yielding every response from a wrapping
+    generator.
+
+    The request must finish within config.router.request_timeout seconds of its
+    first step. The deadline is enforced around each handler step rather than
+    across yields, so it never cancels the consumer while it sends a response.
+    """
+
+    __slots__ = ("_router", "_request", "_responses", "_timer", "_done", "_deadline")
+
+    def __init__(
+        self,
+        router: RequestRouter,
+        request: RouterRequest,
+        responses: AsyncGenerator[WebSocketResponse, None],
+    ):
+        self._router = router
+        self._request = request
+        self._responses = responses
+        self._timer = TimedLogger(
+            logger,
+            "request_processed",
+            request_id=request.request_id,
+            request_type=request.request_type.value,
+        )
+        self._done = False
+        # Loop time by which the handler must finish; set on the first step
+        self._deadline: Optional[float] = None
+        self._timer.__enter__()
+
+    def __aiter__(self) -> "_RoutedStream":
+        return self
+
+    async def __anext__(self) -> WebSocketResponse:
+        if self._done:
+            raise StopAsyncIteration
+
+        request = self._request
+        if self._deadline is None:
+            loop = asyncio.get_running_loop()
+            self._deadline = loop.time() + self._router.config.router.request_timeout
+        try:
+            async with asyncio.timeout_at(self._deadline):
+                return await self._responses.__anext__()
+        except StopAsyncIteration:
+            self._finish()
+            raise
+        except asyncio.TimeoutError:
+            timeout = self._router.config.router.request_timeout
+            logger.warning(
+                event="request_timeout",
+                message="Request timeout",
+                request_id=request.request_id,
+                timeout=timeout,
+            )
+            self._finish()
+            return _error_response(request.request_id, f"Request timeout after {timeout}s")
         except Exception as e:
             logger.error(
-                event="mcp_request_error",
-                message="MCP request processing failed",
+                event="request_failed",
+                message="Request processing failed",
                 request_id=request.request_id,
                 error=str(e),
             )
-            yield WebSocketResponse(
-                request_id=request.request_id,
-                status="error",
-                error=f"MCP processing failed: {str(e)}",
-            )
-
-    async def shutdown(self) -> None:
-        """Gracefully shutdown the router and cleanup resources."""
-        logger.info(event="router_shutdown", message="Router shutting down")
-
-        # TODO: Cleanup adapter connections
-        pass
+            self._finish()
+            return _error_response(request.request_id, f"Request processing failed: {str(e)}")
+
+    async def aclose(self) -> None:
+        """Stop the handler early, e.g. when the client goes away mid-stream."""
+        if not self._done:
+            self._finish()
+            await self._responses.aclose()
+
+    def _finish(self) -> None:
+        """Mark the stream exhausted and log the elapsed request time."""
+        self._done = True
+        self._timer.__exit__(None, None, None)
@@ -0,0 +1,81 @@
+"""
+In-process cache of completed chat responses.
+
+Following PROJECT_RULES.md:
+- Single responsibility: Store and expire streamed responses
+- Bounded memory: LRU eviction plus a TTL per entry
+- Opt-in per request; strict mode is unaffected unless a client asks for it
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from adapters.base import AdapterRequest
+from common.serialization import dumps
+
+# One streamed text chunk: (content, chunk metadata)
+CachedChunk = Tuple[str, Dict[str, Any]]
+
+
+class ResponseCache:
+    """LRU cache with a TTL, mapping chat request keys to their streamed chunks."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (expiry on the monotonic clock, chunks), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, List[CachedChunk]]]" = OrderedDict()
+
+    @staticmethod
+    def key(provider: str, model: str, request: AdapterRequest) -> str:
+        """
+        Build the cache key for a chat request.
+
+        Args:
+            provider: Provider serving the request
+            model: Model serving the request
+            request: Adapter request; every field takes part in the key
+
+        Returns:
+            SHA256 hex digest of the normalized request
+        """
+        # JSON mode turns every field into a plain JSON value
+        normalized = dumps([provider, model, request.model_dump(mode="json")], sort_keys=True)
+        return hashlib.sha256(normalized).hexdigest()
+
+    def get(self, key: str) -> Optional[List[CachedChunk]]:
+        """Return the cached chunks for a key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, chunks = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return chunks
+
+    def put(self, key: str, chunks: List[CachedChunk]) -> None:
+        """Store the chunks for a key, evicting the least recently used entries."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, chunks)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
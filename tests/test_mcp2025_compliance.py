@@ -2,9 +2,16 @@
 Tests for MCP 2025 Compliance Features
 
 Tests the JSON-RPC protocol layer, cursor pagination, capabilities handshake,
-change notifications, and multi-type tool results.
+change notifications, multi-type tool results, provider parameter updates,
+and the stdio transport.
 """
 
+import asyncio
+import copy
+import json
+import os
+import sys
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
@@ -20,6 +27,7 @@ from mcp.jsonrpc import (
     MCPClientCapabilities,
 )
 from mcp.mcp2025_server import MCP2025Server
+from mcp.transports import stdio
 
 
 class TestJSONRPCProtocol:
@@ -471,3 +479,98 @@ class TestErrorHandling:
 
             assert result["isError"] is True
             assert "Tool execution failed" in result["content"][0]["text"]
+
+
+class TestProviderParameters:
+    """Test bulk provider parameter updates."""
+
+    @staticmethod
+    def _server() -> MCP2025Server:
+        """Create MCP server with an in-memory configuration (needs a running loop)."""
+        server = MCP2025Server()
+        server.config_cache = {
+            "provider": {
+                "active": "openai",
+                "models": {"openai": {"model": "gpt-4o-mini", "temperature": 0.7}},
+            }
+        }
+        return server
+
+    @pytest.mark.asyncio
+    async def test_invalid_value_leaves_config_untouched(self):
+        """Test one invalid value rejects the whole batch before anything is written."""
+        mcp_server = self._server()
+        before = copy.deepcopy(mcp_server.config_cache)
+
+        with patch.object(mcp_server.config_persistence, "save_config") as save_config:
+            with pytest.raises(ValueError):
+                await mcp_server.set_provider_parameters(
+                    "openai", {"temperature": 0.5, "max_tokens": 0}
+                )
+
+        assert mcp_server.config_cache == before
+        save_config.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_active_config(self):
+        """Test a successful write saves once and refreshes the active configuration."""
+        mcp_server = self._server()
+        assert (await mcp_server.get_active_provider_config())["temperature"] == 0.7
+
+        with patch.object(
+            mcp_server.config_persistence, "save_config", return_value=True
+        ) as save_config:
+            updated = await mcp_server.set_provider_parameters(
+                "openai", {"temperature": 0.5, "max_tokens": 100}
+            )
+
+        assert updated == {"temperature": True, "max_tokens": True}
+        save_config.assert_called_once()
+        assert mcp_server._active_config is None
+        config = await mcp_server.get_active_provider_config()
+        assert (config["temperature"], config["max_tokens"]) == (0.5, 100)
+
+
+class TestStdioTransport:
+    """Test the stdio transport over OS pipes."""
+
+    @pytest.mark.asyncio
+    async def test_pipe_round_trip(self, monkeypatch):
+        """Test requests are answered in order and an oversized line is skipped."""
+        monkeypatch.setattr(stdio, "STDIN_LINE_LIMIT", 1024)
+        stdin_read, stdin_write = os.pipe()
+        stdout_read, stdout_write = os.pipe()
+        monkeypatch.setattr(sys, "stdin", open(stdin_read, "rb"))
+        # Text mode, as log output shares stdout with the JSON-RPC frames
+        monkeypatch.setattr(sys, "stdout", open(stdout_write, "w"))
+
+        transport = stdio.StdioTransport(MCP2025Server())
+        await transport.start()
+        assert transport._reader is not None and transport._writer is not None
+
+        frames = [
+            {"jsonrpc": "2.0", "id": 1, "method": "invalid/method"},
+            {"jsonrpc": "2.0", "id": 2, "method": "x" * 4096},
+            {"jsonrpc": "2.0", "id": 3, "method": "invalid/method"},
+        ]
+        os.write(stdin_write, b"".join(json.dumps(frame).encode() + b"\n" for frame in frames))
+        os.close(stdin_write)
+
+        # The reader stops at EOF once every frame has been handled
+        await asyncio.wait_for(transport.reader_task, timeout=5)
+        await transport.stop()
+        sys.stdout.close()
+
+        with open(stdout_read, "rb") as out:
+            responses = [
+                json.loads(line)
+                for line in out.read().splitlines()
+                if line.startswith(b'{"jsonrpc"')
+            ]
+        sys.stdin.close()
+
+        assert [response["id"] for response in responses] == [1, None, 3]
+        assert responses[0]["error"]["code"] == -32601  # METHOD_NOT_FOUND
+        assert responses[1]["error"]["code"] == -32700  # PARSE_ERROR
+        assert "exceeds 1024 bytes" in responses[1]["error"]["message"]
+        assert responses[2]["error"]["code"] == -32601
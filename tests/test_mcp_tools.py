@@ -0,0 +1,150 @@
+"""
+Tests for MCP configuration tools
+
+Tests the shared provider fan-out helper and how the configuration tools
+use the MCP server.
+"""
+
+import asyncio
+
+import pytest
+
+from mcp.tools._fanout import fanout
+from mcp.tools.parameter_info_tool import ParameterInfoTool
+from mcp.tools.reset_config_tool import ResetConfigTool
+from mcp.tools.switch_provider_tool import SwitchProviderTool
+
+
+class FakeServer:
+    """Minimal MCP server stand-in with a per-provider method."""
+
+    async def get_available_models(self, provider: str):
+        if provider == "broken":
+            raise ValueError(f"Provider '{provider}' not supported")
+        return {"provider": provider, "models": [{"name": f"{provider}-model"}]}
+
+
+class TestFanout:
+    """Test concurrent per-provider calls."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_provider_order(self):
+        """Test results are keyed by provider in the given order."""
+        results = await fanout(FakeServer(), "get_available_models", ["openai", "gemini"])
+
+        assert list(results) == ["openai", "gemini"]
+        assert results["gemini"]["models"][0]["name"] == "gemini-model"
+
+    @pytest.mark.asyncio
+    async def test_exceptions_become_error_entries(self):
+        """Test a failing provider does not affect the others."""
+        results = await fanout(FakeServer(), "get_available_models", ["broken", "openai"])
+
+        assert results["broken"] == {"error": "Provider 'broken' not supported"}
+        assert results["openai"]["provider"] == "openai"
+
+
+class SchemaServer:
+    """MCP server stand-in whose providers only know 'temperature'."""
+
+    def __init__(self):
+        self.constraint_calls = 0
+
+    async def get_active_provider_config(self):
+        return {"provider": "openai", "model": "gpt-4o-mini"}
+
+    async def has_parameter(self, provider: str, param_name: str) -> bool:
+        return param_name == "temperature"
+
+    async def get_parameter_constraints(self, provider: str):
+        self.constraint_calls += 1
+        return {}
+
+
+class TestParameterInfo:
+    """Test get_parameter_info lookups."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_parameter_skips_constraints(self):
+        """Test an unknown parameter is reported without building constraints."""
+        server = SchemaServer()
+        result = await ParameterInfoTool(server).execute({"parameter": "bogus"})
+
+        assert result["status"] == "success"
+        assert result["parameter_info"] == "Parameter 'bogus' not found for provider 'openai'"
+        assert server.constraint_calls == 0
+
+
+class ResetServer:
+    """MCP server stand-in whose provider resets finish in reverse order."""
+
+    PROVIDERS = ["openai", "anthropic", "gemini"]
+
+    async def get_active_provider_config(self):
+        return {"provider": "openai", "model": "gpt-4o-mini"}
+
+    async def get_available_providers(self):
+        return list(self.PROVIDERS)
+
+    async def get_parameter_values(self, provider: str):
+        if provider == "gemini":
+            return {"temperature": (0.7, 0.7)}
+        return {"temperature": (1.5, 0.7)}
+
+    async def reset_to_defaults(self, provider: str) -> bool:
+        # Later providers finish first
+        await asyncio.sleep(0.01 * (len(self.PROVIDERS) - self.PROVIDERS.index(provider)))
+        if provider == "anthropic":
+            raise RuntimeError("write failed")
+        return True
+
+
+class TestResetConfig:
+    """Test reset_config across providers."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_resets_report_per_provider(self):
+        """Test each provider's outcome is reported under that provider."""
+        result = await ResetConfigTool(ResetServer()).execute({"provider": "all", "confirm": True})
+
+        assert result["status"] == "partial_success"
+        assert result["details"] == {
+            "openai": "success",
+            "anthropic": "error: write failed",
+            "gemini": "no_changes",
+        }
+        assert result["providers_reset"] == 1
+        assert result["errors"] == 1
+
+
+class SwitchServer:
+    """MCP server stand-in that records configuration writes."""
+
+    def __init__(self):
+        self.writes = []
+
+    async def get_active_provider_config(self):
+        return {"provider": "openai", "model": "gpt-4o-mini"}
+
+    async def switch_active_provider(self, provider: str) -> bool:
+        self.writes.append(("switch_active_provider", provider))
+        return True
+
+    async def set_provider_parameter(self, provider: str, name: str, value) -> bool:
+        self.writes.append(("set_provider_parameter", provider, name, value))
+        return True
+
+
+class TestSwitchProvider:
+    """Test switch_provider short-circuits."""
+
+    @pytest.mark.asyncio
+    async def test_current_provider_and_model_is_a_no_op(self):
+        """Test switching to the active provider and model writes nothing."""
+        server = SwitchServer()
+        result = await SwitchProviderTool(server).execute(
+            {"provider": "openai", "model": "gpt-4o-mini", "confirm": True}
+        )
+
+        assert result["status"] == "no_change"
+        assert server.writes == []
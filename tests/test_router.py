@@ -4,12 +4,18 @@ Tests for the request router.
 Added 2025-07-05: Comprehensive tests for router functionality.
 """
 
+import asyncio
+
 import pytest
 
+from adapters.base import AdapterRequest, AdapterResponse, BaseAdapter
+from adapters.key_balanced_adapter import KeyBalancedAdapter
 from common.config import Config
 from common.models import ChunkType
+from mcp.mcp2025_server import MCP2025Server
 from router.message_types import RequestType, RouterRequest
-from router.request_router import RequestRouter
+from router.request_router import RequestRouter, _api_keys, _coalesce_content
+from router.response_cache import ResponseCache
 
 
 @pytest.fixture
@@ -158,7 +164,7 @@ async def test_request_timeout_handling(router: RequestRouter) -> None:
     # but for now we test that the router initializes correctly
     assert router.config is not None
     # With multi-provider support, we should have adapters available
-    assert len(router.adapters) > 0
+    assert len(router.available_providers) > 0
     # Test that we can get an active adapter
     active_adapter = router._get_active_adapter()
     assert active_adapter is not None
@@ -186,3 +192,180 @@ async def test_invalid_request_type() -> None:
     assert RequestType.CHAT.value == "chat"
     assert RequestType.AUDIO_STREAM.value == "audio_stream"
     assert RequestType.FRONTEND_COMMAND.value == "frontend_command"
+
+
+def test_api_keys_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a comma-separated key list takes precedence over the single key."""
+    monkeypatch.setenv("TEST_API_KEY", "single")
+    monkeypatch.delenv("TEST_API_KEYS", raising=False)
+    assert _api_keys("TEST_API_KEY") == ["single"]
+
+    monkeypatch.setenv("TEST_API_KEYS", "key1, key2,,key1")
+    assert _api_keys("TEST_API_KEY") == ["key1", "key2"]
+
+
+@pytest.mark.asyncio
+async def test_key_balanced_adapter_spreads_requests() -> None:
+    """Test that concurrent requests are spread evenly across API keys."""
+
+    class KeyAdapter(BaseAdapter):
+        def __init__(self, key: str):
+            super().__init__(object())  # type: ignore
+            self.key = key
+
+        def supports_function_calling(self) -> bool:
+            return True
+
+        def supports_streaming(self) -> bool:
+            return True
+
+        def translate_tools(self, mcp_tools):
+            return mcp_tools
+
+        async def chat_completion(self, request):
+            await asyncio.sleep(0.01)
+            yield AdapterResponse(content=self.key)
+
+        async def health_check(self) -> bool:
+            return True
+
+    balanced = KeyBalancedAdapter([KeyAdapter("a"), KeyAdapter("b"), KeyAdapter("c")])
+    request = AdapterRequest(messages=[])
+
+    async def run() -> list:
+        return [response.content async for response in balanced.chat_completion(request)]
+
+    results = await asyncio.gather(*(run() for _ in range(6)))
+    contents = sorted(content for result in results for content in result)
+    assert contents == ["a", "a", "b", "b", "c", "c"]
+    assert await balanced.health_check()
+
+
+def test_response_cache_evicts_and_expires() -> None:
+    """Test LRU eviction and TTL expiry of cached chat responses."""
+    cache = ResponseCache(max_entries=2, ttl=60.0)
+    request = AdapterRequest(messages=[{"role": "user", "content": "hi"}])
+    key = ResponseCache.key("openai", "gpt-4o-mini", request)
+    assert key == ResponseCache.key("openai", "gpt-4o-mini", request)
+    assert key != ResponseCache.key("anthropic", "gpt-4o-mini", request)
+
+    cache.put("a", [("one", {})])
+    cache.put("b", [("two", {})])
+    assert cache.get("a") == [("one", {})]
+    cache.put("c", [("three", {})])
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    expired = ResponseCache(max_entries=2, ttl=0.0)
+    expired.put("a", [("one", {})])
+    assert expired.get("a") is None
+
+
+async def _stream(*items):
+    """Yield adapter responses, sleeping for any float item."""
+    for item in items:
+        if isinstance(item, float):
+            await asyncio.sleep(item)
+        else:
+            yield item
+
+
+async def _coalesced(*items) -> list:
+    return [
+        (response.content, response.finish_reason, bool(response.tool_calls))
+        async for response in _coalesce_content(_stream(*items))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_on_size() -> None:
+    """Test that buffered text is sent once it reaches STREAM_COALESCE_CHARS."""
+    piece = "x" * 40
+    out = await _coalesced(
+        AdapterResponse(content=piece),
+        AdapterResponse(content=piece),
+        AdapterResponse(content="tail"),
+    )
+    assert out == [(piece * 2, None, False), ("tail", None, False)]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_on_time_during_stall() -> None:
+    """Test that buffered text is sent when the provider stalls past the deadline."""
+    loop = asyncio.get_running_loop()
+    stream = _coalesce_content(
+        _stream(AdapterResponse(content="Hi"), 0.5, AdapterResponse(content=" there"))
+    )
+    start = loop.time()
+    first = await stream.__anext__()
+    assert first.content == "Hi"
+    assert loop.time() - start < 0.25
+    assert [response.content async for response in stream] == [" there"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_before_finish_and_tool_calls() -> None:
+    """Test that buffered text precedes finish_reason and tool-call responses."""
+    tool_call = {"id": "c1", "name": "ai_configure", "arguments": "{}"}
+    out = await _coalesced(
+        AdapterResponse(content="Hel"),
+        AdapterResponse(content="lo"),
+        AdapterResponse(tool_calls=[tool_call]),
+        AdapterResponse(content="!"),
+        AdapterResponse(content="done", finish_reason="stop"),
+    )
+    assert out == [
+        ("Hello", None, False),
+        (None, None, True),
+        ("!", None, False),
+        ("done", "stop", False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_request_timeout_closes_stalled_handler(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a stalled adapter ends the stream with one timeout error frame."""
+    adapter_closed = []
+
+    class StalledAdapter:
+        async def chat_completion(self, request):
+            try:
+                yield AdapterResponse(content="partial")
+                await asyncio.Event().wait()
+            finally:
+                adapter_closed.append(True)
+
+    monkeypatch.setattr(RequestRouter, "_initialize_adapters", lambda self: None)
+    config = Config()
+    config.router.request_timeout = 1
+    router = RequestRouter(config, MCP2025Server())
+    router.adapters.update(
+        dict.fromkeys(("openai", "anthropic", "gemini", "openrouter"), StalledAdapter())
+    )
+
+    handlers = []
+    handle_chat = router._dispatch[RequestType.CHAT]
+
+    def tracked_handler(request):
+        handlers.append(handle_chat(request))
+        return handlers[-1]
+
+    router._dispatch[RequestType.CHAT] = tracked_handler
+
+    request = RouterRequest(
+        request_id="stalled",
+        request_type=RequestType.CHAT,
+        payload={"text": "hi"},
+        connection_id="conn",
+    )
+    responses = [response async for response in router.process_request(request)]
+
+    errors = [response for response in responses if response.status == "error"]
+    assert len(errors) == 1
+    assert errors[0] is responses[-1]
+    assert errors[0].error == "Request timeout after 1s"
+    assert responses[0].chunk.data == "partial"
+    # The handler generator is closed; the cancelled adapter read unwinds on the next loop turn
+    assert handlers[0].ag_frame is None
+    await asyncio.sleep(0)
+    assert adapter_closed == [True]